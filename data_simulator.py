@@ -7,7 +7,7 @@ from pcrm import contacts, interactions, occasions, tags, database
 fake = Faker()
 
 def create_random_contact(fake_generator):
-    """Creates a single random contact."""
+    """Generates the details for a single random contact, ready for add_contacts_bulk."""
     first_name = fake_generator.first_name()
     last_name = fake_generator.last_name()
     email = fake_generator.email()
@@ -16,29 +16,22 @@ def create_random_contact(fake_generator):
     how_met = random.choice(["at a conference", "through a friend", "at work", "at a social event"])
     favorite_color = fake_generator.color_name()
 
-    return contacts.add_contact(
-        first_name,
-        last_name,
-        email=email,
-        birthday=birthday,
-        date_met=date_met,
-        how_met=how_met,
-        favorite_color=favorite_color
-    )
-
-def add_random_phones_to_contact(contact_id, fake_generator):
-    """Adds a random number of phones to a contact."""
+    return (first_name, last_name, None, None, email, birthday, date_met, how_met, favorite_color)
+
+def create_random_phones(fake_generator):
+    """Generates a random number of (phone_number, phone_type) pairs for a contact."""
+    phones = []
     for _ in range(random.randint(0, 2)):
         phone_number = fake_generator.phone_number()
         phone_type = random.choice(["mobile", "home", "work"])
-        contacts.add_phone_to_contact(contact_id, phone_number, phone_type)
+        phones.append((phone_number, phone_type))
+    return phones
 
-def add_random_pets_to_contact(contact_id, fake_generator):
-    """Adds a random number of pets to a contact."""
+def create_random_pet_names(fake_generator):
+    """Generates the names of a contact's pets, if they have any."""
     if random.random() < 0.2:  # 20% chance of having a pet
-        for _ in range(random.randint(1, 2)):
-            pet_name = fake_generator.first_name()
-            contacts.add_pet_to_contact(contact_id, pet_name)
+        return [fake_generator.first_name() for _ in range(random.randint(1, 2))]
+    return []
 
 def add_random_notes_to_contact(full_name, contact_id, fake_generator):
     """Adds a random number of notes to a contact."""
@@ -100,21 +93,25 @@ def run_simulator(num_contacts=50):
     tag_options = tags.DEFAULT_TAGS
 
 
-    # Generate contacts
-    contact_ids = []
-    for i in range(num_contacts):
-        print(f"Creating contact {i + 1}/{num_contacts}...")
-        contact_id = create_random_contact(fake)
-        if contact_id:
-            contact_ids.append(contact_id)
-            full_name = get_contact_name(contact_id)
-            add_random_phones_to_contact(contact_id, fake)
-            add_random_pets_to_contact(contact_id, fake)
-            add_random_notes_to_contact(full_name, contact_id, fake)
-            add_random_reminders_to_contact(full_name, contact_id, fake)
-            add_random_special_occasions(full_name, contact_id, fake)
-            add_random_gifts(full_name, contact_id, fake)
-            add_random_tags_to_contact(full_name, contact_id, tag_options)
+    # Generate contacts with their phones and pets, inserting them all in one
+    # transaction. add_contacts_bulk reads the contacts, then the phones, then
+    # the pets, so each is generated as it is inserted rather than held in a list.
+    print(f"Creating {num_contacts} contacts...")
+    contact_rows = (create_random_contact(fake) for _ in range(num_contacts))
+    phones = ((i, phone_number, phone_type)
+              for i in range(num_contacts)
+              for phone_number, phone_type in create_random_phones(fake))
+    pets = ((i, pet_name) for i in range(num_contacts) for pet_name in create_random_pet_names(fake))
+    contact_ids = contacts.add_contacts_bulk(contact_rows, phones, pets)
+
+    for i, contact_id in enumerate(contact_ids):
+        print(f"Adding details for contact {i + 1}/{len(contact_ids)}...")
+        full_name = get_contact_name(contact_id)
+        add_random_notes_to_contact(full_name, contact_id, fake)
+        add_random_reminders_to_contact(full_name, contact_id, fake)
+        add_random_special_occasions(full_name, contact_id, fake)
+        add_random_gifts(full_name, contact_id, fake)
+        add_random_tags_to_contact(full_name, contact_id, tag_options)
 
     # Generate relationships
     print("Creating relationships...")
@@ -1,9 +1,28 @@
+import re
 import sqlite3
 import datetime
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from .database import get_db_connection
+from functools import lru_cache
+from .database import get_db_connection, insert_many
+
+# rich is only needed by the commands that print to the terminal, so it is
+# imported on first use rather than whenever this module is loaded.
+@lru_cache(maxsize=1)
+def _get_console():
+    """Returns the shared rich Console, creating it on first use."""
+    from rich.console import Console
+    return Console()
+
+# Matches a menu selection such as "2" (surrounding whitespace allowed).
+_CHOICE_RE = re.compile(r'^\s*(\d+)\s*$')
+
+# SQL for the frequently repeated writes. Keeping the text identical on every
+# call lets sqlite3's statement cache reuse the prepared statement.
+_INSERT_CONTACT_SQL = """INSERT INTO contacts
+    (first_name, last_name, chosen_name, pronouns, email, birthday, date_met, how_met, favorite_color, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_INSERT_PHONE_SQL = "INSERT INTO phones (contact_id, phone_number, phone_type) VALUES (?, ?, ?)"
+_INSERT_PET_SQL = "INSERT INTO pets (contact_id, name) VALUES (?, ?)"
+_UPDATE_LAST_CONTACTED_SQL = "UPDATE contacts SET last_contacted_at = ? WHERE id = ?"
 
 # This function is internal to the contacts module but will be used by other modules.
 def _update_last_contacted(contact_id):
@@ -11,7 +30,7 @@ def _update_last_contacted(contact_id):
     with get_db_connection() as conn:
         cursor = conn.cursor()
         now = datetime.datetime.now()
-        cursor.execute("UPDATE contacts SET last_contacted_at = ? WHERE id = ?", (now, contact_id))
+        cursor.execute(_UPDATE_LAST_CONTACTED_SQL, (now, contact_id))
         conn.commit()
 
 def add_contact(first_name, last_name, chosen_name=None, pronouns=None, email=None, birthday=None, date_met=None, how_met=None, favorite_color=None):
@@ -21,28 +40,62 @@ def add_contact(first_name, last_name, chosen_name=None, pronouns=None, email=No
         with get_db_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """INSERT INTO contacts
-                   (first_name, last_name, chosen_name, pronouns, email, birthday, date_met, how_met, favorite_color, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                _INSERT_CONTACT_SQL,
                 (first_name, last_name, chosen_name, pronouns, email, birthday, date_met, how_met, favorite_color, now)
             )
             contact_id = cursor.lastrowid
             conn.commit()
+            clear_name_cache()
             print(f"Successfully added {first_name} {last_name}.")
             return contact_id
     except sqlite3.IntegrityError as e:
         print(f"Error: {e}")
         return None
 
+def add_contacts_bulk(rows, phones=(), pets=()):
+    """
+    Adds many contacts in a single transaction.
+    Each row is a tuple of add_contact's arguments in order:
+    (first_name, last_name, chosen_name, pronouns, email, birthday, date_met, how_met, favorite_color).
+    rows can be any iterable, including a generator; it is streamed into the
+    insert rather than collected into a list first.
+    phones and pets optionally hold (row_index, phone_number, phone_type) and
+    (row_index, name) entries for the new contacts, where row_index is the
+    contact's position in rows. They are inserted in the same transaction,
+    after every row has been read, and can be generators as well.
+    Returns the new contact IDs in the same order as the rows.
+    """
+    now = datetime.datetime.now()
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(_INSERT_CONTACT_SQL, ((*row, now) for row in rows))
+            count = cursor.rowcount
+            if count <= 0:
+                return []
+            # Rows inserted by one executemany inside one transaction get consecutive IDs
+            cursor.execute("SELECT last_insert_rowid()")
+            last_id = cursor.fetchone()[0]
+            first_id = last_id - count + 1
+            insert_many(
+                cursor, "phones", ("contact_id", "phone_number", "phone_type"),
+                ((first_id + i, phone_number, phone_type) for i, phone_number, phone_type in phones)
+            )
+            insert_many(cursor, "pets", ("contact_id", "name"), ((first_id + i, name) for i, name in pets))
+            conn.commit()
+            clear_name_cache()
+    except sqlite3.IntegrityError as e:
+        print(f"Error: {e}")
+        return []
+    print(f"Successfully added {count} contacts.")
+    return list(range(first_id, last_id + 1))
+
 def add_phone_to_contact(contact_id, phone_number, phone_type):
     """Adds a phone number to a contact."""
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO phones (contact_id, phone_number, phone_type) VALUES (?, ?, ?)",
-                (contact_id, phone_number, phone_type)
-            )
+            cursor.execute(_INSERT_PHONE_SQL, (contact_id, phone_number, phone_type))
             conn.commit()
             print(f"Successfully added phone number to contact.")
     except sqlite3.IntegrityError as e:
@@ -53,15 +106,32 @@ def add_pet_to_contact(contact_id, name):
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO pets (contact_id, name) VALUES (?, ?)",
-                (contact_id, name)
-            )
+            cursor.execute(_INSERT_PET_SQL, (contact_id, name))
             conn.commit()
             print(f"Successfully added pet to contact.")
     except sqlite3.IntegrityError as e:
         print(f"Error: {e}")
 
+def add_phones_to_contact(contact_id, phones):
+    """Adds several (phone_number, phone_type) pairs to a contact in one transaction."""
+    try:
+        with get_db_connection() as conn:
+            conn.executemany(_INSERT_PHONE_SQL, [(contact_id, number, phone_type) for number, phone_type in phones])
+            conn.commit()
+            print(f"Successfully added {len(phones)} phone numbers to contact.")
+    except sqlite3.IntegrityError as e:
+        print(f"Error: {e}")
+
+def add_pets_to_contact(contact_id, names):
+    """Adds several pets to a contact in one transaction."""
+    try:
+        with get_db_connection() as conn:
+            conn.executemany(_INSERT_PET_SQL, [(contact_id, name) for name in names])
+            conn.commit()
+            print(f"Successfully added {len(names)} pets to contact.")
+    except sqlite3.IntegrityError as e:
+        print(f"Error: {e}")
+
 def add_relationship(contact1_id, contact2_id, relationship_type):
     """Adds a relationship between two contacts."""
     if contact1_id == contact2_id:
@@ -70,12 +140,10 @@ def add_relationship(contact1_id, contact2_id, relationship_type):
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            # Ensure the relationship is stored consistently (lower ID first)
-            if contact1_id > contact2_id:
-                contact1_id, contact2_id = contact2_id, contact1_id
+            # Store the relationship consistently (lower ID first)
             cursor.execute(
-                "INSERT INTO relationships (contact1_id, contact2_id, relationship_type) VALUES (?, ?, ?)",
-                (contact1_id, contact2_id, relationship_type)
+                "INSERT INTO relationships (contact1_id, contact2_id, relationship_type) VALUES (MIN(?, ?), MAX(?, ?), ?)",
+                (contact1_id, contact2_id, contact1_id, contact2_id, relationship_type)
             )
             conn.commit()
             print(f"Successfully added relationship.")
@@ -87,12 +155,10 @@ def remove_relationship(contact1_id, contact2_id):
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            # Ensure the relationship is found regardless of order
-            if contact1_id > contact2_id:
-                contact1_id, contact2_id = contact2_id, contact1_id
+            # Find the relationship regardless of the order the IDs were given in
             cursor.execute(
-                "DELETE FROM relationships WHERE contact1_id = ? AND contact2_id = ?",
-                (contact1_id, contact2_id)
+                "DELETE FROM relationships WHERE contact1_id = MIN(?, ?) AND contact2_id = MAX(?, ?)",
+                (contact1_id, contact2_id, contact1_id, contact2_id)
             )
             conn.commit()
             if cursor.rowcount > 0:
@@ -103,82 +169,145 @@ def remove_relationship(contact1_id, contact2_id):
         print(f"Database error: {e}")
 
 def get_relationships_for_contact(contact_id):
-    """Fetches all relationships for a given contact."""
+    """
+    Fetches all relationships for a given contact.
+    Each row has the related contact's id, display_name and the relationship_type.
+    """
     with get_db_connection() as conn:
         cursor = conn.cursor()
+        # One branch per side of the relationship so each can use its own index
         cursor.execute("""
             SELECT
                 r.relationship_type,
-                c.id, c.first_name, c.last_name
+                c.id, TRIM(c.first_name || ' ' || COALESCE(c.last_name, '')) AS display_name
             FROM relationships r
-            JOIN contacts c ON (c.id = r.contact2_id OR c.id = r.contact1_id)
-            WHERE (r.contact1_id = ? OR r.contact2_id = ?) AND c.id != ?
-        """, (contact_id, contact_id, contact_id))
+            JOIN contacts c ON c.id = r.contact2_id
+            WHERE r.contact1_id = ?
+            UNION ALL
+            SELECT
+                r.relationship_type,
+                c.id, TRIM(c.first_name || ' ' || COALESCE(c.last_name, '')) AS display_name
+            FROM relationships r
+            JOIN contacts c ON c.id = r.contact1_id
+            WHERE r.contact2_id = ?
+        """, (contact_id, contact_id))
         return cursor.fetchall()
 
 def get_all_contact_names():
     """Fetches all contact full names from the database."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT first_name, last_name FROM contacts ORDER BY first_name, last_name")
-        contacts = cursor.fetchall()
+        # Only one column is read by position, so plain tuples are enough here
+        cursor.row_factory = None
+        cursor.execute("""
+            SELECT TRIM(first_name || ' ' || COALESCE(last_name, '')) AS full_name
+            FROM contacts
+            ORDER BY first_name, last_name
+        """)
+        return [row[0] for row in cursor.fetchall()]
 
-    names = []
-    for contact in contacts:
-        full_name = f"{contact['first_name']} {contact['last_name'] or ''}".strip()
-        names.append(full_name)
-    return names
 
+# Results of find_contacts_by_name, keyed by normalized name. Interactive
+# commands often look up the same name several times in a row.
+_name_cache = {}
+
+def clear_name_cache():
+    """Forgets cached name lookups. Call after contacts are added, deleted or renamed."""
+    _name_cache.clear()
 
 def find_contacts_by_name(full_name):
     """
     Finds contacts by name, case-insensitively.
     Returns a list of matching contacts (as sqlite3.Row objects).
     """
+    name_parts = full_name.strip().split()
+    # NOCASE only folds ASCII letters, so only those are folded in the key
+    key = ' '.join(name_parts)
+    if key.isascii():
+        key = key.lower()
+    cached = _name_cache.get(key)
+    if cached is not None:
+        return cached
+
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        name_parts = full_name.strip().split()
 
+        # COLLATE NOCASE matches the idx_contacts_name indexes, so these are
+        # index lookups rather than a LOWER() over every row.
         if len(name_parts) == 1:
             # If one name is given, search both first and last names for an exact match
-            term = name_parts[0].lower()
+            term = name_parts[0]
             cursor.execute(
-                "SELECT id, first_name, last_name FROM contacts WHERE LOWER(first_name) = ? OR LOWER(last_name) = ?",
+                "SELECT id, first_name, last_name FROM contacts WHERE first_name = ? COLLATE NOCASE OR last_name = ? COLLATE NOCASE",
                 (term, term)
             )
         else:
-            first_name = name_parts[0].lower()
-            last_name = ' '.join(name_parts[1:]).lower()
+            first_name = name_parts[0]
+            last_name = ' '.join(name_parts[1:])
             cursor.execute(
-                "SELECT id, first_name, last_name FROM contacts WHERE LOWER(first_name) = ? AND LOWER(last_name) = ?",
+                "SELECT id, first_name, last_name FROM contacts WHERE first_name = ? COLLATE NOCASE AND last_name = ? COLLATE NOCASE",
                 (first_name, last_name)
             )
 
         results = cursor.fetchall()
-        return results
+    _name_cache[key] = results
+    return results
+
+# Columns advanced_search_contacts matches through the contacts_fts index.
+# The date columns aren't in the index and still use LIKE.
+_FTS_SEARCH_FIELDS = frozenset({"first_name", "last_name", "email", "how_met", "favorite_color"})
+_LIKE_SEARCH_FIELDS = frozenset({"birthday", "date_met"})
+
+def _fts_column_query(column, value):
+    """
+    Builds an FTS5 query matching each word of value as a prefix within column.
+    Words are quoted so characters like '-' or ':' aren't read as query syntax.
+    """
+    words = ['"' + word.replace('"', '""') + '"*' for word in value.split()]
+    return f"{column}:({' '.join(words)})"
+
+@lru_cache(maxsize=64)
+def _build_search_query(use_fts, like_keys):
+    """
+    Returns the advanced search SQL for a given shape of criteria, so repeated
+    searches on the same fields reuse the same string. The full-text MATCH
+    parameter comes first, followed by one LIKE parameter per key in like_keys.
+    """
+    where_clauses = []
+    if use_fts:
+        where_clauses.append("id IN (SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH ?)")
+    where_clauses.extend(f"{key} LIKE ?" for key in like_keys)
+    return (
+        "SELECT id, first_name, last_name, email, birthday, date_met, how_met, favorite_color FROM contacts"
+        f" WHERE {' AND '.join(where_clauses)} ORDER BY first_name, last_name"
+    )
 
 def advanced_search_contacts(criteria):
     """
     Searches for contacts based on a dictionary of criteria.
     Criteria keys should be valid column names in the contacts table.
-    Values will be searched for using a LIKE query.
+    Text fields are matched by word prefix using the full-text index;
+    date fields are searched for using a LIKE query.
     """
-    console = Console()
-    base_query = "SELECT id, first_name, last_name, email, birthday, date_met, how_met, favorite_color FROM contacts"
-    where_clauses = []
-    params = []
-
-    for key, value in criteria.items():
-        # Basic validation to ensure key is a valid column name
-        if key in ["first_name", "last_name", "email", "birthday", "date_met", "how_met", "favorite_color"]:
-            where_clauses.append(f"{key} LIKE ?")
-            params.append(f"%{value}%")
-
-    if not where_clauses:
+    console = _get_console()
+
+    # Basic validation to ensure keys are valid column names. Keys are sorted
+    # so the cached query doesn't depend on the order criteria were given in.
+    fts_terms = [
+        _fts_column_query(key, criteria[key])
+        for key in sorted(criteria.keys() & _FTS_SEARCH_FIELDS)
+        if criteria[key].strip()
+    ]
+    like_keys = tuple(sorted(criteria.keys() & _LIKE_SEARCH_FIELDS))
+
+    if not fts_terms and not like_keys:
         console.print("No valid search criteria provided.", style="bold red")
         return
 
-    query = f"{base_query} WHERE {' AND '.join(where_clauses)} ORDER BY first_name, last_name"
+    query = _build_search_query(bool(fts_terms), like_keys)
+    params = [f"%{criteria[key]}%" for key in like_keys]
+    if fts_terms:
+        params.insert(0, " AND ".join(fts_terms))
 
     try:
         with get_db_connection() as conn:
@@ -193,6 +322,7 @@ def advanced_search_contacts(criteria):
         console.print("No contacts found matching your criteria.", style="yellow")
         return
 
+    from rich.table import Table
     table = Table(title="Advanced Search Results", show_header=True, header_style="bold blue")
     table.add_column("ID", style="dim")
     table.add_column("First Name")
@@ -210,7 +340,7 @@ def advanced_search_contacts(criteria):
 
 def list_contacts(tag_name=None):
     """Lists all contacts, optionally filtering by a tag."""
-    console = Console()
+    console = _get_console()
     with get_db_connection() as conn:
         cursor = conn.cursor()
 
@@ -228,25 +358,27 @@ def list_contacts(tag_name=None):
             cursor.execute("SELECT id, first_name, last_name FROM contacts ORDER BY first_name, last_name")
             header = "--- Your Contacts ---"
 
-        contacts = cursor.fetchall()
+        # Print rows as the cursor yields them instead of loading the whole list first
+        header_printed = False
+        for contact in cursor:
+            if not header_printed:
+                console.print(header, style="bold blue")
+                header_printed = True
+            last_name = contact['last_name'] or ''
+            console.print(f"- {contact['first_name']} {last_name}", style="blue")
 
-    if not contacts:
+    if not header_printed:
         if tag_name:
             console.print(f"No contacts found with the tag '{tag_name}'.", style="yellow")
         else:
             console.print("No contacts found. Add one with the 'add' command.", style="yellow")
-        return
-
-    console.print(header, style="bold blue")
-    for contact in contacts:
-        last_name = contact['last_name'] or ''
-        console.print(f"- {contact['first_name']} {last_name}", style="blue")
 
 
-def choose_contact(full_name):
+def choose_contact_row(full_name):
     """
     Finds contacts by name and handles ambiguity by prompting the user.
-    Returns a single contact ID or None if no contact is chosen.
+    Returns the chosen contact's row (id, first_name, last_name) or None if
+    no contact is chosen.
     """
     contacts = find_contacts_by_name(full_name)
 
@@ -255,7 +387,7 @@ def choose_contact(full_name):
         return None
 
     if len(contacts) == 1:
-        return contacts[0]['id']
+        return contacts[0]
 
     # Multiple contacts found, prompt user to choose
     print(f"\nMultiple contacts found for '{full_name}'. Please choose one:")
@@ -264,23 +396,56 @@ def choose_contact(full_name):
         print(f"  {i + 1}: {contact['first_name']} {last_name} (ID: {contact['id']})")
 
     while True:
-        try:
-            choice = input("Enter the number of the contact (or 'q' to cancel): ")
-            if choice.lower() == 'q':
-                print("Operation cancelled.")
-                return None
-
-            choice_index = int(choice) - 1
-            if 0 <= choice_index < len(contacts):
-                return contacts[choice_index]['id']
-            else:
-                print("Invalid number. Please try again.")
-        except ValueError:
+        choice = input("Enter the number of the contact (or 'q' to cancel): ")
+        if choice.lower() == 'q':
+            print("Operation cancelled.")
+            return None
+
+        match = _CHOICE_RE.match(choice)
+        if not match:
             print("Invalid input. Please enter a number.")
+            continue
+
+        choice_index = int(match.group(1)) - 1
+        if 0 <= choice_index < len(contacts):
+            return contacts[choice_index]
+        else:
+            print("Invalid number. Please try again.")
+
+def choose_contact(full_name):
+    """
+    Finds contacts by name and handles ambiguity by prompting the user.
+    Returns a single contact ID or None if no contact is chosen.
+    """
+    contact = choose_contact_row(full_name)
+    return contact['id'] if contact else None
+
+# Everything view_contact shows besides the contact row itself, in one query.
+# Each row is tagged with the kind of record it came from. The dates come back
+# as plain 'YYYY-MM-DD' strings, since type converters don't apply across a UNION.
+_CONTACT_DETAILS_SQL = """
+SELECT kind, value, detail FROM (
+    SELECT 'phone' AS kind, phone_number AS value, phone_type AS detail, NULL AS sort_key
+    FROM phones WHERE contact_id = :id
+    UNION ALL
+    SELECT 'pet', name, NULL, NULL FROM pets WHERE contact_id = :id
+    UNION ALL
+    SELECT 'note', note_text, substr(created_at, 1, 10), created_at FROM notes WHERE contact_id = :id
+    UNION ALL
+    SELECT 'reminder', message, reminder_date, reminder_date FROM reminders WHERE contact_id = :id
+    UNION ALL
+    SELECT 'tag', t.name, NULL, NULL
+    FROM tags t JOIN contact_tags ct ON t.id = ct.tag_id WHERE ct.contact_id = :id
+)
+-- Notes are listed newest first, reminders soonest first.
+ORDER BY kind, CASE WHEN kind = 'note' THEN NULL ELSE sort_key END, sort_key DESC
+"""
 
 def view_contact(full_name):
     """Displays detailed information for a specific contact using rich."""
-    console = Console()
+    from rich.panel import Panel
+    from rich.table import Table
+    console = _get_console()
     contact_id = choose_contact(full_name)
     if not contact_id:
         return
@@ -289,19 +454,23 @@ def view_contact(full_name):
         cursor = conn.cursor()
 
         # Get all data in one go
-        cursor.execute("SELECT * FROM contacts WHERE id = ?", (contact_id,))
+        cursor.execute("""
+            SELECT first_name, last_name, chosen_name, pronouns, email, birthday, date_met,
+                   how_met, favorite_color, last_contacted_at, created_at
+            FROM contacts WHERE id = ?
+        """, (contact_id,))
         contact = cursor.fetchone()
-        cursor.execute("SELECT phone_number, phone_type FROM phones WHERE contact_id = ?", (contact_id,))
-        phones = cursor.fetchall()
-        cursor.execute("SELECT name FROM pets WHERE contact_id = ?", (contact_id,))
-        pets = cursor.fetchall()
+        cursor.execute(_CONTACT_DETAILS_SQL, {'id': contact_id})
+        details_by_kind = {'phone': [], 'pet': [], 'note': [], 'reminder': [], 'tag': []}
+        for row in cursor:
+            details_by_kind[row['kind']].append(row)
         relationships = get_relationships_for_contact(contact_id)
-        cursor.execute("SELECT note_text, created_at FROM notes WHERE contact_id = ? ORDER BY created_at DESC", (contact_id,))
-        notes = cursor.fetchall()
-        cursor.execute("SELECT message, reminder_date FROM reminders WHERE contact_id = ? ORDER BY reminder_date ASC", (contact_id,))
-        reminders = cursor.fetchall()
-        cursor.execute("SELECT t.name FROM tags t JOIN contact_tags ct ON t.id = ct.tag_id WHERE ct.contact_id = ?", (contact_id,))
-        tags = [row['name'] for row in cursor.fetchall()]
+
+    phones = details_by_kind['phone']
+    pets = details_by_kind['pet']
+    notes = details_by_kind['note']
+    reminders = details_by_kind['reminder']
+    tags = [row['value'] for row in details_by_kind['tag']]
 
     # Main Details Panel
     last_contacted_str = contact['last_contacted_at'].strftime('%Y-%m-%d') if contact['last_contacted_at'] else '[red]Never[/red]'
@@ -335,14 +504,14 @@ def view_contact(full_name):
         table.add_column("Number")
         table.add_column("Type")
         for phone in phones:
-            table.add_row(phone['phone_number'], phone['phone_type'])
+            table.add_row(phone['value'], phone['detail'])
         console.print(table)
 
     if pets:
         table = Table(title="Pets", show_header=True, header_style="bold green")
         table.add_column("Name")
         for pet in pets:
-            table.add_row(pet['name'])
+            table.add_row(pet['value'])
         console.print(table)
 
     if relationships:
@@ -350,7 +519,7 @@ def view_contact(full_name):
         table.add_column("Contact")
         table.add_column("Relationship")
         for rel in relationships:
-            table.add_row(f"{rel['first_name']} {rel['last_name'] or ''}", rel['relationship_type'])
+            table.add_row(rel['display_name'], rel['relationship_type'])
         console.print(table)
 
     if notes:
@@ -358,7 +527,7 @@ def view_contact(full_name):
         table.add_column("Date", style="dim")
         table.add_column("Note")
         for note in notes:
-            table.add_row(note['created_at'].strftime('%Y-%m-%d'), note['note_text'])
+            table.add_row(note['detail'], note['value'])
         console.print(table)
 
     if reminders:
@@ -366,25 +535,17 @@ def view_contact(full_name):
         table.add_column("Date", style="dim")
         table.add_column("Message")
         for reminder in reminders:
-            table.add_row(reminder['reminder_date'], reminder['message'])
+            table.add_row(reminder['detail'], reminder['value'])
         console.print(table)
 
 
 def delete_contact(full_name):
     """Deletes a contact and all their associated data."""
-    contact_id = choose_contact(full_name)
-    if not contact_id:
-        return
-
-    # To get the name for the confirmation prompt, we need to fetch it.
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT first_name, last_name FROM contacts WHERE id = ?", (contact_id,))
-        contact = cursor.fetchone()
-
+    # The chosen row already has the name for the confirmation prompt.
+    contact = choose_contact_row(full_name)
     if not contact:
-        print(f"Could not find contact with ID {contact_id} to delete.") # Should not happen
         return
+    contact_id = contact['id']
 
     contact_full_name = f"{contact['first_name']} {contact['last_name'] or ''}".strip()
 
@@ -394,27 +555,64 @@ def delete_contact(full_name):
             cursor = conn.cursor()
             cursor.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
             conn.commit()
+        clear_name_cache()
         print(f"Contact {contact_full_name} has been deleted.")
     else:
         print("Deletion cancelled.")
 
 
+# Maps edit_contact menu choices to (column, prompt label, display label).
+_EDITABLE_FIELDS = {
+    '2': ('email', 'email', 'Email'),
+    '3': ('birthday', 'birthday (YYYY-MM-DD)', 'Birthday'),
+    '4': ('date_met', 'date met (YYYY-MM-DD)', 'Date met'),
+    '5': ('how_met', 'how met', 'How met'),
+    '6': ('favorite_color', 'favorite color', 'Favorite color'),
+    '7': ('chosen_name', 'chosen name', 'Chosen name'),
+    '8': ('pronouns', 'pronouns', 'Pronouns'),
+}
+
+def _save_contact_edits(contact_id, changes):
+    """Writes all pending edits for a contact with a single UPDATE."""
+    # Column names come from _EDITABLE_FIELDS, never from user input.
+    assignments = ", ".join(f"{column} = ?" for column in changes)
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"UPDATE contacts SET {assignments} WHERE id = ?", (*changes.values(), contact_id))
+        conn.commit()
+    if 'first_name' in changes:
+        clear_name_cache()
+
 def edit_contact(full_name):
-    """Finds a contact and allows the user to edit their details."""
-    contact_id = choose_contact(full_name)
-    if not contact_id:
+    """
+    Finds a contact and allows the user to edit their details.
+    Field edits, phones and pets are collected while the menu is open and
+    saved together when the user returns to the main menu.
+    """
+    chosen = choose_contact_row(full_name)
+    if not chosen:
         return
+    contact_id = chosen['id']
 
-    while True:
-        # Fetch fresh contact details each time in the loop
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM contacts WHERE id = ?", (contact_id,))
-            contact = cursor.fetchone()
-        if not contact:
-            print(f"Error: Could not retrieve contact with ID {contact_id}.")
-            return
+    # Fetch the contact once; edits are applied to this local copy so the
+    # menu always shows the current values without going back to the database.
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT first_name, last_name, email, birthday, date_met, how_met,
+                   favorite_color, chosen_name, pronouns
+            FROM contacts WHERE id = ?
+        """, (contact_id,))
+        row = cursor.fetchone()
+    if not row:
+        print(f"Error: Could not retrieve contact with ID {contact_id}.")
+        return
+    contact = dict(row)
 
+    pending_changes = {}
+    new_phones = []
+    new_pets = []
+    while True:
         current_full_name = f"{contact['first_name']} {contact['last_name'] or ''}".strip()
         print(f"\n--- Editing Contact: {current_full_name} ---")
         print("1. Edit Name")
@@ -435,73 +633,35 @@ def edit_contact(full_name):
             new_first_name = input(f"Enter new first name (current: {contact['first_name']}): ").strip()
             new_last_name = input(f"Enter new last name (current: {contact['last_name'] or ''}): ").strip()
             if new_first_name:
-                with get_db_connection() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("UPDATE contacts SET first_name = ?, last_name = ? WHERE id = ?",
-                                   (new_first_name, new_last_name or None, contact_id))
-                    conn.commit()
+                pending_changes['first_name'] = contact['first_name'] = new_first_name
+                pending_changes['last_name'] = contact['last_name'] = new_last_name or None
                 print("Name updated.")
             else:
                 print("First name cannot be empty.")
-        elif choice == '2':
-            new_email = input(f"Enter new email (current: {contact['email'] or 'N/A'}): ").strip()
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("UPDATE contacts SET email = ? WHERE id = ?", (new_email, contact_id))
-                conn.commit()
-            print("Email updated.")
-        elif choice == '3':
-            new_birthday = input(f"Enter new birthday (YYYY-MM-DD) (current: {contact['birthday'] or 'N/A'}): ").strip()
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("UPDATE contacts SET birthday = ? WHERE id = ?", (new_birthday, contact_id))
-                conn.commit()
-            print("Birthday updated.")
-        elif choice == '4':
-            new_date_met = input(f"Enter new date met (YYYY-MM-DD) (current: {contact['date_met'] or 'N/A'}): ").strip()
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("UPDATE contacts SET date_met = ? WHERE id = ?", (new_date_met, contact_id))
-                conn.commit()
-            print("Date met updated.")
-        elif choice == '5':
-            new_how_met = input(f"Enter new how met (current: {contact['how_met'] or 'N/A'}): ").strip()
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("UPDATE contacts SET how_met = ? WHERE id = ?", (new_how_met, contact_id))
-                conn.commit()
-            print("How met updated.")
-        elif choice == '6':
-            new_favorite_color = input(f"Enter new favorite color (current: {contact['favorite_color'] or 'N/A'}): ").strip()
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("UPDATE contacts SET favorite_color = ? WHERE id = ?", (new_favorite_color, contact_id))
-                conn.commit()
-            print("Favorite color updated.")
-        elif choice == '7':
-            new_chosen_name = input(f"Enter new chosen name (current: {contact['chosen_name'] or 'N/A'}): ").strip()
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("UPDATE contacts SET chosen_name = ? WHERE id = ?", (new_chosen_name, contact_id))
-                conn.commit()
-            print("Chosen name updated.")
-        elif choice == '8':
-            new_pronouns = input(f"Enter new pronouns (current: {contact['pronouns'] or 'N/A'}): ").strip()
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("UPDATE contacts SET pronouns = ? WHERE id = ?", (new_pronouns, contact_id))
-                conn.commit()
-            print("Pronouns updated.")
+        elif choice in _EDITABLE_FIELDS:
+            column, prompt_label, display_label = _EDITABLE_FIELDS[choice]
+            new_value = input(f"Enter new {prompt_label} (current: {contact[column] or 'N/A'}): ").strip()
+            pending_changes[column] = contact[column] = new_value or None
+            print(f"{display_label} updated.")
         elif choice == '9':
             phone_number = input("Enter phone number: ").strip()
             phone_type = input("Enter phone type (e.g., mobile, home, work): ").strip()
             if phone_number:
-                add_phone_to_contact(contact_id, phone_number, phone_type)
+                new_phones.append((phone_number, phone_type))
+                print("Phone number added.")
         elif choice == '10':
             pet_name = input("Enter pet's name: ").strip()
             if pet_name:
-                add_pet_to_contact(contact_id, pet_name)
+                new_pets.append(pet_name)
+                print("Pet added.")
         elif choice == '11':
+            if pending_changes:
+                _save_contact_edits(contact_id, pending_changes)
+                print("Changes saved.")
+            if new_phones:
+                add_phones_to_contact(contact_id, new_phones)
+            if new_pets:
+                add_pets_to_contact(contact_id, new_pets)
             break
         else:
             print("Invalid choice. Please try again.")
@@ -1,70 +1,80 @@
 import csv
-import json
+import orjson
 from .database import get_db_connection
 
+# Tables included in the JSON export, in the order they are written
+EXPORT_TABLES = ["contacts", "relationships", "tags", "contact_tags", "phones", "pets", "notes"]
+
+def _iter_rows(cursor, sql):
+    """Yields each row of a query as a dict, without fetching them all first."""
+    cursor.execute(sql)
+    for row in cursor:
+        yield dict(row)
+
+def _dumps(obj):
+    """
+    Compact JSON encoding as bytes. orjson handles dates and numpy arrays
+    natively; default=str covers anything else.
+    """
+    return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
 def export_data_to_json(app_instance):
     """Exports all application data to a JSON file."""
-    # Get graph layout from the GUI instance
+    # Get graph layout from the GUI instance. The numpy position arrays are
+    # serialized as-is.
     graph_layout = {}
     if app_instance and app_instance.graph_pos:
-        # Convert numpy arrays to lists for JSON serialization
-        for node_id, pos in app_instance.graph_pos.items():
-            graph_layout[node_id] = pos.tolist()
+        graph_layout = app_instance.graph_pos
 
-    with get_db_connection() as conn:
+    filename = "pcrm_export.json"
+    with get_db_connection() as conn, open(filename, 'wb') as f:
         cursor = conn.cursor()
 
-        # Fetch all data from the database
-        cursor.execute("SELECT * FROM contacts")
-        contacts = [dict(row) for row in cursor.fetchall()]
-
-        cursor.execute("SELECT * FROM relationships")
-        relationships = [dict(row) for row in cursor.fetchall()]
-
-        cursor.execute("SELECT * FROM tags")
-        tags = [dict(row) for row in cursor.fetchall()]
-
-        cursor.execute("SELECT * FROM contact_tags")
-        contact_tags = [dict(row) for row in cursor.fetchall()]
-
-        cursor.execute("SELECT * FROM phones")
-        phones = [dict(row) for row in cursor.fetchall()]
-
-        cursor.execute("SELECT * FROM pets")
-        pets = [dict(row) for row in cursor.fetchall()]
-
-        cursor.execute("SELECT * FROM notes")
-        notes = [dict(row) for row in cursor.fetchall()]
-
-    # Combine into a single exportable object
-    export_data = {
-        "contacts": contacts,
-        "relationships": relationships,
-        "tags": tags,
-        "contact_tags": contact_tags,
-        "phones": phones,
-        "pets": pets,
-        "notes": notes,
-        "graph_layout": graph_layout
-    }
-
-    filename = "pcrm_export.json"
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(export_data, f, indent=4, default=str) # Use default=str for any non-serializable types like dates
+        # Stream each table straight into the file one row at a time, so the
+        # whole database never has to be held in memory at once.
+        f.write(b'{')
+        for table in EXPORT_TABLES:
+            f.write(_dumps(table) + b':[')
+            for i, row in enumerate(_iter_rows(cursor, f"SELECT * FROM {table}")):
+                if i:
+                    f.write(b',')
+                f.write(_dumps(row))
+            f.write(b'],')
+        f.write(b'"graph_layout":' + _dumps(graph_layout) + b'}')
 
     print(f"Successfully exported all data to {filename}")
 
 
+# One row per contact, with the child tables folded into single columns by
+# GROUP_CONCAT. The subqueries are index lookups on contact_id. Columns are in
+# the CSV's order, so rows can be written exactly as they come back (csv.writer
+# already writes NULLs as empty fields).
+_CSV_EXPORT_SQL = """
+SELECT
+    c.id, c.first_name, COALESCE(c.last_name, ''), c.email, c.birthday,
+    c.date_met, c.how_met, c.favorite_color,
+    (SELECT GROUP_CONCAT(phone_number || '(' || IFNULL(phone_type, '') || ')', ' | ')
+     FROM phones WHERE contact_id = c.id) AS phones,
+    (SELECT GROUP_CONCAT(name, ' | ') FROM pets WHERE contact_id = c.id) AS pets,
+    (SELECT GROUP_CONCAT(note_text, ' | ') FROM notes WHERE contact_id = c.id) AS notes,
+    (SELECT GROUP_CONCAT(t.name, ', ')
+     FROM contact_tags ct JOIN tags t ON t.id = ct.tag_id
+     WHERE ct.contact_id = c.id) AS tags
+FROM contacts c
+"""
+
 def export_data_to_csv():
     """Exports all contact data to a CSV file."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
 
-        # Get all contacts
-        cursor.execute("SELECT * FROM contacts")
-        contacts = cursor.fetchall()
+        # Get all contacts along with their phones, pets, notes and tags,
+        # as plain tuples for the csv writer
+        cursor.row_factory = None
+        cursor.execute(_CSV_EXPORT_SQL)
+        first_contact = cursor.fetchone()
 
-        if not contacts:
+        if not first_contact:
             print("No contacts to export.")
             return
 
@@ -75,49 +85,9 @@ def export_data_to_csv():
                 'date_met', 'how_met', 'favorite_color', 'phones', 'pets',
                 'notes', 'tags'
             ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for contact in contacts:
-                contact_id = contact['id']
-
-                # Get phones
-                cursor.execute("SELECT phone_number, phone_type FROM phones WHERE contact_id = ?", (contact_id,))
-                phones = cursor.fetchall()
-                phones_str = " | ".join([f"{p['phone_number']}({p['phone_type']})" for p in phones])
-
-                # Get pets
-                cursor.execute("SELECT name FROM pets WHERE contact_id = ?", (contact_id,))
-                pets = cursor.fetchall()
-                pets_str = " | ".join([p['name'] for p in pets])
-
-                # Get notes for the contact
-                cursor.execute("SELECT note_text FROM notes WHERE contact_id = ?", (contact_id,))
-                notes = cursor.fetchall()
-                notes_str = " | ".join([note['note_text'] for note in notes])
-
-                # Get tags for the contact
-                cursor.execute("""
-                    SELECT t.name FROM tags t
-                    JOIN contact_tags ct ON t.id = ct.tag_id
-                    WHERE ct.contact_id = ?
-                """, (contact_id,))
-                tags = cursor.fetchall()
-                tags_str = ", ".join([tag['name'] for tag in tags])
-
-                writer.writerow({
-                    'contact_id': contact_id,
-                    'first_name': contact['first_name'],
-                    'last_name': contact['last_name'] or '',
-                    'email': contact['email'],
-                    'birthday': contact['birthday'],
-                    'date_met': contact['date_met'],
-                    'how_met': contact['how_met'],
-                    'favorite_color': contact['favorite_color'],
-                    'phones': phones_str,
-                    'pets': pets_str,
-                    'notes': notes_str,
-                    'tags': tags_str,
-                })
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerow(first_contact)
+            writer.writerows(cursor)
 
     print(f"Successfully exported all data to {filename}")
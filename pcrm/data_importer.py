@@ -1,15 +1,76 @@
-import json
 import sqlite3
-from .database import get_db_connection
+from itertools import chain, islice
+from operator import itemgetter
+import ijson
+from .database import get_db_connection, CACHE_SIZE, IMPORT_CACHE_SIZE
+from .contacts import clear_name_cache
+
+# Rows passed to each executemany call. executemany binds one row at a time,
+# so SQLite's limit on variables per statement doesn't apply here (it does for
+# multi-row VALUES inserts, which database.insert_many keeps under
+# MAX_VARIABLES). Batching keeps only one chunk of row tuples in memory.
+IMPORT_BATCH_ROWS = 10000
+
+def _row_getter(columns):
+    """
+    Returns a function that pulls the values for columns out of an imported
+    item as a tuple. itemgetter does this in one C-level call; items missing
+    a key get None for it.
+    """
+    if len(columns) == 1:
+        # itemgetter returns a bare value rather than a tuple for one key
+        column = columns[0]
+        return lambda item: (item.get(column),)
+
+    get_values = itemgetter(*columns)
+    defaults = dict.fromkeys(columns)
+
+    def row_values(item):
+        try:
+            return get_values(item)
+        except KeyError:
+            return get_values({**defaults, **item})
+    return row_values
+
+def _map_columns(cursor, table_name, keys):
+    """
+    Matches the keys of an imported item to the table's columns. Keys are
+    normalized first (a stray BOM or whitespace stripped, case folded) and
+    checked with set operations, so every unknown key or missing required
+    column is reported at once. Returns a dict of file key -> column name.
+    """
+    cursor.execute(f"PRAGMA table_info({table_name});")
+    table_columns = cursor.fetchall()
+    known = {col['name'] for col in table_columns}
+    required = {col['name'] for col in table_columns
+                if col['notnull'] and col['dflt_value'] is None and not col['pk']}
+
+    col_map = {key: key.lstrip('\ufeff').strip().lower() for key in keys}
+    fields = set(col_map.values())
+
+    unknown = fields - known
+    if unknown:
+        raise ValueError(f"unknown columns for {table_name}: {', '.join(sorted(unknown))}")
+    missing = required - fields
+    if missing:
+        raise ValueError(f"missing required columns for {table_name}: {', '.join(sorted(missing))}")
+    return col_map
+
+def _iter_json(filepath, prefix):
+    """
+    Streams the objects at prefix (e.g. 'contacts.item') out of a JSON file,
+    so only one of them is held in memory at a time. Numbers come back as
+    floats rather than Decimals, which sqlite3 can't bind.
+    """
+    with open(filepath, 'rb') as f:
+        yield from ijson.items(f, prefix, use_float=True)
 
 def import_data_from_json(filepath):
     """
     Imports data from a JSON file, replacing all existing data.
     Returns the graph layout if it exists in the file.
+    The file is read table by table rather than loaded all at once.
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
     with get_db_connection() as conn:
         cursor = conn.cursor()
 
@@ -18,13 +79,31 @@ def import_data_from_json(filepath):
         tables = ["contact_tags", "pets", "phones", "notes", "relationships", "tags", "contacts"]
 
         try:
-            # Disable foreign keys for the duration of the transaction
+            # A larger page cache keeps the tables and indexes being rebuilt in memory
+            cursor.execute(f"PRAGMA cache_size = {IMPORT_CACHE_SIZE};")
+            # Foreign keys are switched off for the import (this has no effect
+            # inside a transaction, so it comes before BEGIN). Otherwise clearing
+            # contacts would cascade into reminders, special occasions and gifts,
+            # which aren't in the export and so could never be restored. The
+            # imported tables are checked by hand before committing instead.
             cursor.execute("PRAGMA foreign_keys = OFF;")
-            conn.commit()
 
             # Begin a transaction
             cursor.execute("BEGIN TRANSACTION;")
 
+            # Drop the imported tables' secondary indexes and triggers, and put
+            # them back once the data is in. Building an index once over the full
+            # table is much cheaper than updating it on every insert. This is
+            # inside the transaction, so a failed import restores them as well.
+            table_params = ", ".join(["?"] * len(tables))
+            cursor.execute(f"""
+                SELECT type, name, sql FROM sqlite_master
+                WHERE type IN ('index', 'trigger') AND sql IS NOT NULL AND tbl_name IN ({table_params})
+            """, tables)
+            schema_objects = cursor.fetchall()
+            for obj in schema_objects:
+                cursor.execute(f"DROP {obj['type'].upper()} {obj['name']};")
+
             # Clear existing data from tables
             for table in tables:
                 print(f"Clearing table: {table}")
@@ -33,20 +112,43 @@ def import_data_from_json(filepath):
             # Import new data
             # The order of insertion should be the reverse of deletion
             for table_name in reversed(tables):
-                if table_name in data and data[table_name]:
+                items = _iter_json(filepath, f"{table_name}.item")
+                first_item = next(items, None)
+                if first_item is not None:
                     print(f"Importing data for table: {table_name}")
-                    items = data[table_name]
 
-                    # Get column names from the first item
-                    columns = items[0].keys()
-                    col_str = ", ".join(columns)
-                    placeholders = ", ".join(["?"] * len(columns))
+                    # Get column names from the first item, checked against the table
+                    col_map = _map_columns(cursor, table_name, first_item.keys())
+                    keys = list(col_map)
+                    col_str = ", ".join(col_map.values())
+                    placeholders = ", ".join(["?"] * len(keys))
+
+                    # Prepare rows of data. Values are looked up by the keys as
+                    # they appear in the file, so items never need renaming.
+                    rows = map(_row_getter(keys), chain([first_item], items))
 
-                    # Prepare rows of data
-                    rows = [tuple(item.get(col) for col in columns) for item in items]
+                    # The tables were emptied above, so a plain INSERT keeps the old IDs.
+                    # A duplicate key in the file fails the import rather than
+                    # silently overwriting the earlier row.
+                    sql = f"INSERT INTO {table_name} ({col_str}) VALUES ({placeholders})"
+                    while batch := list(islice(rows, IMPORT_BATCH_ROWS)):
+                        conn.executemany(sql, batch)
 
-                    # Use INSERT OR REPLACE to handle potential conflicts and use the old IDs
-                    cursor.executemany(f"INSERT OR REPLACE INTO {table_name} ({col_str}) VALUES ({placeholders})", rows)
+            print("Rebuilding indexes")
+            for obj in schema_objects:
+                cursor.execute(obj['sql'])
+            # The triggers that keep the full-text index in sync were dropped too
+            cursor.execute("INSERT INTO contacts_fts (contacts_fts) VALUES ('rebuild');")
+
+            # Fail the import if any imported row points at a missing parent
+            for table in tables:
+                cursor.execute(f"PRAGMA foreign_key_check({table});")
+                violation = cursor.fetchone()
+                if violation is not None:
+                    raise sqlite3.IntegrityError(
+                        f"FOREIGN KEY constraint failed: {table} row {violation['rowid']} "
+                        f"references a missing {violation['parent']} row"
+                    )
 
             # Commit the transaction
             conn.commit()
@@ -54,10 +156,21 @@ def import_data_from_json(filepath):
         except sqlite3.Error as e:
             conn.rollback() # Rollback on error
             raise Exception(f"Database error during import: {e}")
+        except ijson.JSONError as e:
+            conn.rollback()
+            raise Exception(f"Invalid JSON in import file: {e}")
+        except ValueError as e:
+            conn.rollback()
+            raise Exception(f"Import file does not match the database: {e}")
         finally:
-            # Re-enable foreign keys
+            # Anything not handled above still has the transaction open, and
+            # foreign_keys can only be switched back on outside of one
+            if conn.in_transaction:
+                conn.rollback()
+            cursor.execute(f"PRAGMA cache_size = {CACHE_SIZE};")
             cursor.execute("PRAGMA foreign_keys = ON;")
-            conn.commit()
 
+    # Every contact may have changed, so cached name lookups are stale
+    clear_name_cache()
     print("Successfully imported data.")
-    return data.get("graph_layout")
+    return next(_iter_json(filepath, "graph_layout"), None)
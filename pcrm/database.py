@@ -1,6 +1,9 @@
+import atexit
 import sqlite3
 import datetime
+import threading
 from contextlib import contextmanager
+from .utils import parse_date
 
 # --- Datetime handling for SQLite ---
 # The default adapter is deprecated in Python 3.12
@@ -16,154 +19,313 @@ def convert_timestamp(ts):
 sqlite3.register_adapter(datetime.datetime, adapt_datetime_iso)
 sqlite3.register_converter("timestamp", convert_timestamp)
 
+def sql_iso_date(value):
+    """
+    The iso_date() SQL function: a date as zero-padded YYYY-MM-DD text, or
+    NULL if it isn't a date parse_date accepts. SQLite's own date functions
+    return NULL for unpadded dates such as 2024-1-5, which the app accepts.
+    """
+    if value is None:
+        return None
+    try:
+        return parse_date(str(value)).isoformat()
+    except ValueError:
+        return None
+
 
 # --- Database Setup and Management ---
 
 DB_FILE = "personal_crm.db"
 
+# Page cache sizes in KiB (negative values are KiB in SQLite)
+CACHE_SIZE = -64000  # ~64MB
+IMPORT_CACHE_SIZE = -262144  # ~256MB, for bulk imports
+
+# Database files this process has already switched to WAL mode
+_wal_files = set()
+
 def connect_to_db():
     """Establishes a connection to the SQLite database."""
-    conn = sqlite3.connect(DB_FILE, detect_types=sqlite3.PARSE_DECLTYPES)
+    # Keep more prepared statements around than the default of 128
+    conn = sqlite3.connect(DB_FILE, detect_types=sqlite3.PARSE_DECLTYPES, cached_statements=256)
     conn.row_factory = sqlite3.Row  # Allows accessing columns by name
+    conn.create_function("iso_date", 1, sql_iso_date, deterministic=True)
+    # Write-ahead logging lets reads carry on during writes, and with it
+    # synchronous=NORMAL only syncs at checkpoints instead of on every commit.
+    # The journal mode is saved in the database file, so it only has to be set
+    # by the first connection to each file.
+    if DB_FILE not in _wal_files:
+        conn.execute("PRAGMA journal_mode = WAL")
+        _wal_files.add(DB_FILE)
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")  # 256MB
+    conn.execute(f"PRAGMA cache_size = {CACHE_SIZE}")
+    # Foreign keys are off by default in SQLite and must be enabled per connection,
+    # otherwise the ON DELETE CASCADE clauses in the schema are ignored.
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+# Each thread keeps one long-lived connection, since sqlite3 connections
+# can't be shared between threads by default.
+_local = threading.local()
+
+def get_connection():
+    """Returns this thread's shared database connection, opening it on first use."""
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = _local.conn = connect_to_db()
+        _local.depth = 0
     return conn
 
 @contextmanager
 def get_db_connection():
     """
-    A context manager for handling database connections.
-    It ensures the connection is automatically closed.
+    A context manager that provides this thread's shared database connection.
+    Reusing the connection keeps SQLite's page and statement caches warm.
+    As when every block had its own connection, anything left uncommitted
+    when the outermost block exits is rolled back.
     """
-    conn = connect_to_db()
+    conn = get_connection()
+    _local.depth += 1
     try:
         yield conn
+    finally:
+        _local.depth -= 1
+        if _local.depth == 0 and conn.in_transaction:
+            conn.rollback()
+
+def close_db():
+    """Closes this thread's shared connection, if one is open."""
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        return
+    _local.conn = None
+    try:
+        # Lets SQLite refresh planner statistics for the tables this connection
+        # queried. It is cheap and usually a no-op.
+        conn.execute("PRAGMA optimize")
     finally:
         conn.close()
 
+atexit.register(close_db)
+
+# SQLite's default cap on bound parameters in one statement (SQLITE_MAX_VARIABLE_NUMBER)
+MAX_VARIABLES = 32766
+# Rows per multi-row INSERT. Using one fixed size keeps the SQL text the same
+# between calls, so the prepared statement is reused from the cache.
+MULTI_INSERT_ROWS = 500
+
+def insert_many(cursor, table, columns, rows):
+    """
+    Inserts rows (tuples in the order of columns) using multi-row
+    INSERT ... VALUES (...), (...) statements, which cross into SQLite far less
+    often than one execute per row. Rows that don't fill a whole chunk go
+    through executemany with the single-row statement.
+    table and columns are put into the SQL directly, so they must never come
+    from user input.
+    """
+    col_str = ", ".join(columns)
+    row_placeholders = f"({', '.join(['?'] * len(columns))})"
+    chunk_rows = max(1, min(MULTI_INSERT_ROWS, MAX_VARIABLES // len(columns)))
+    chunk_size = chunk_rows * len(columns)
+    chunk_sql = f"INSERT INTO {table} ({col_str}) VALUES {', '.join([row_placeholders] * chunk_rows)}"
+
+    params = []
+    for row in rows:
+        params.extend(row)
+        if len(params) == chunk_size:
+            cursor.execute(chunk_sql, params)
+            params = []
+
+    if params:
+        width = len(columns)
+        cursor.executemany(
+            f"INSERT INTO {table} ({col_str}) VALUES {row_placeholders}",
+            (params[i:i + width] for i in range(0, len(params), width))
+        )
+
+# The whole schema, run as one script by create_tables. Every statement is
+# IF NOT EXISTS, so it is safe to run on every start.
+_SCHEMA_SQL = """
+BEGIN;
+
+-- Create contacts table
+CREATE TABLE IF NOT EXISTS contacts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    first_name TEXT NOT NULL,
+    last_name TEXT,
+    chosen_name TEXT,
+    pronouns TEXT,
+    email TEXT,
+    birthday DATE,
+    date_met DATE,
+    how_met TEXT,
+    favorite_color TEXT,
+    last_contacted_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create phones table
+CREATE TABLE IF NOT EXISTS phones (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    contact_id INTEGER NOT NULL,
+    phone_number TEXT NOT NULL,
+    phone_type TEXT,
+    FOREIGN KEY (contact_id) REFERENCES contacts (id) ON DELETE CASCADE
+);
+
+-- Create pets table
+CREATE TABLE IF NOT EXISTS pets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    contact_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    FOREIGN KEY (contact_id) REFERENCES contacts (id) ON DELETE CASCADE
+);
+
+-- Create relationships table
+CREATE TABLE IF NOT EXISTS relationships (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    contact1_id INTEGER NOT NULL,
+    contact2_id INTEGER NOT NULL,
+    relationship_type TEXT NOT NULL,
+    FOREIGN KEY (contact1_id) REFERENCES contacts (id) ON DELETE CASCADE,
+    FOREIGN KEY (contact2_id) REFERENCES contacts (id) ON DELETE CASCADE,
+    UNIQUE (contact1_id, contact2_id)
+);
+
+-- Create notes table
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    contact_id INTEGER NOT NULL,
+    note_text TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (contact_id) REFERENCES contacts (id) ON DELETE CASCADE
+);
+
+-- Create reminders table
+CREATE TABLE IF NOT EXISTS reminders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    contact_id INTEGER NOT NULL,
+    message TEXT NOT NULL,
+    reminder_date DATE NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (contact_id) REFERENCES contacts (id) ON DELETE CASCADE
+);
+
+-- Create tags table for categorizing contacts
+CREATE TABLE IF NOT EXISTS tags (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL
+);
+
+-- Create a join table for the many-to-many relationship between contacts and tags
+CREATE TABLE IF NOT EXISTS contact_tags (
+    contact_id INTEGER NOT NULL,
+    tag_id INTEGER NOT NULL,
+    PRIMARY KEY (contact_id, tag_id),
+    FOREIGN KEY (contact_id) REFERENCES contacts (id) ON DELETE CASCADE,
+    FOREIGN KEY (tag_id) REFERENCES tags (id) ON DELETE CASCADE
+);
+
+-- Create special occasions table
+CREATE TABLE IF NOT EXISTS special_occasions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    contact_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    date DATE NOT NULL,
+    FOREIGN KEY (contact_id) REFERENCES contacts (id) ON DELETE CASCADE
+);
+
+-- Create gifts table
+CREATE TABLE IF NOT EXISTS gifts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    contact_id INTEGER NOT NULL,
+    occasion_id INTEGER,
+    description TEXT NOT NULL,
+    direction TEXT NOT NULL, -- "given" or "received"
+    date DATE,
+    FOREIGN KEY (contact_id) REFERENCES contacts (id) ON DELETE CASCADE,
+    FOREIGN KEY (occasion_id) REFERENCES special_occasions (id) ON DELETE SET NULL
+);
+
+-- Index the child tables' contact_id columns so cascading deletes and
+-- per-contact lookups don't have to scan the whole table.
+-- (contact_tags and relationships.contact1_id are covered by their keys.)
+CREATE INDEX IF NOT EXISTS idx_phones_contact ON phones (contact_id);
+CREATE INDEX IF NOT EXISTS idx_pets_contact ON pets (contact_id);
+CREATE INDEX IF NOT EXISTS idx_notes_contact ON notes (contact_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_reminders_contact ON reminders (contact_id, reminder_date);
+CREATE INDEX IF NOT EXISTS idx_relationships_contact2 ON relationships (contact2_id);
+CREATE INDEX IF NOT EXISTS idx_special_occasions_contact ON special_occasions (contact_id);
+CREATE INDEX IF NOT EXISTS idx_gifts_contact ON gifts (contact_id);
+
+-- The other side of the remaining foreign keys: deleting a tag or an occasion
+-- has to find the rows that point at it, and listing a tag's contacts starts
+-- from the tag.
+CREATE INDEX IF NOT EXISTS idx_contact_tags_tag ON contact_tags (tag_id, contact_id);
+CREATE INDEX IF NOT EXISTS idx_gifts_occasion ON gifts (occasion_id);
+
+-- Case-insensitive name lookups (find_contacts_by_name). The separate
+-- last_name index lets a search on either name use an index.
+CREATE INDEX IF NOT EXISTS idx_contacts_name ON contacts (first_name COLLATE NOCASE, last_name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_contacts_last_name ON contacts (last_name COLLATE NOCASE);
+-- Contact lists are ordered by name. This index (which also carries the
+-- id) lets those queries walk it in order instead of sorting.
+CREATE INDEX IF NOT EXISTS idx_contacts_sort ON contacts (first_name, last_name);
+
+-- The dashboard and list_reminders pick reminders by date range across all
+-- contacts, and the dashboard's suggestions by when a contact was last seen.
+CREATE INDEX IF NOT EXISTS idx_reminders_date ON reminders (reminder_date);
+CREATE INDEX IF NOT EXISTS idx_contacts_last_contacted ON contacts (last_contacted_at);
+
+-- Full-text index over the contacts' free-text columns, used by
+-- advanced_search_contacts. It is an external-content table, so it only
+-- stores the index; the triggers below keep it in sync with contacts.
+CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5(
+    first_name, last_name, email, how_met, favorite_color,
+    content='contacts', content_rowid='id', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS contacts_fts_insert AFTER INSERT ON contacts BEGIN
+    INSERT INTO contacts_fts (rowid, first_name, last_name, email, how_met, favorite_color)
+    VALUES (new.id, new.first_name, new.last_name, new.email, new.how_met, new.favorite_color);
+END;
+CREATE TRIGGER IF NOT EXISTS contacts_fts_delete AFTER DELETE ON contacts BEGIN
+    INSERT INTO contacts_fts (contacts_fts, rowid, first_name, last_name, email, how_met, favorite_color)
+    VALUES ('delete', old.id, old.first_name, old.last_name, old.email, old.how_met, old.favorite_color);
+END;
+CREATE TRIGGER IF NOT EXISTS contacts_fts_update
+AFTER UPDATE OF first_name, last_name, email, how_met, favorite_color ON contacts BEGIN
+    INSERT INTO contacts_fts (contacts_fts, rowid, first_name, last_name, email, how_met, favorite_color)
+    VALUES ('delete', old.id, old.first_name, old.last_name, old.email, old.how_met, old.favorite_color);
+    INSERT INTO contacts_fts (rowid, first_name, last_name, email, how_met, favorite_color)
+    VALUES (new.id, new.first_name, new.last_name, new.email, new.how_met, new.favorite_color);
+END;
+
+COMMIT;
+"""
+
 def create_tables():
     """Creates the necessary database tables if they don't already exist."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
 
-        # Create contacts table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS contacts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            first_name TEXT NOT NULL,
-            last_name TEXT,
-            chosen_name TEXT,
-            pronouns TEXT,
-            email TEXT,
-            birthday DATE,
-            date_met DATE,
-            how_met TEXT,
-            favorite_color TEXT,
-            last_contacted_at TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        """)
-
-        # Create phones table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS phones (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            contact_id INTEGER NOT NULL,
-            phone_number TEXT NOT NULL,
-            phone_type TEXT,
-            FOREIGN KEY (contact_id) REFERENCES contacts (id) ON DELETE CASCADE
-        );
-        """)
-
-        # Create pets table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS pets (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            contact_id INTEGER NOT NULL,
-            name TEXT NOT NULL,
-            FOREIGN KEY (contact_id) REFERENCES contacts (id) ON DELETE CASCADE
-        );
-        """)
-
-        # Create relationships table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS relationships (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            contact1_id INTEGER NOT NULL,
-            contact2_id INTEGER NOT NULL,
-            relationship_type TEXT NOT NULL,
-            FOREIGN KEY (contact1_id) REFERENCES contacts (id) ON DELETE CASCADE,
-            FOREIGN KEY (contact2_id) REFERENCES contacts (id) ON DELETE CASCADE,
-            UNIQUE (contact1_id, contact2_id)
-        );
-        """)
-
-        # Create notes table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS notes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            contact_id INTEGER NOT NULL,
-            note_text TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (contact_id) REFERENCES contacts (id) ON DELETE CASCADE
-        );
-        """)
-
-        # Create reminders table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS reminders (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            contact_id INTEGER NOT NULL,
-            message TEXT NOT NULL,
-            reminder_date DATE NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (contact_id) REFERENCES contacts (id) ON DELETE CASCADE
-        );
-        """)
-
-        # Create tags table for categorizing contacts
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS tags (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE NOT NULL
-        );
-        """)
-
-        # Create a join table for the many-to-many relationship between contacts and tags
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS contact_tags (
-            contact_id INTEGER NOT NULL,
-            tag_id INTEGER NOT NULL,
-            PRIMARY KEY (contact_id, tag_id),
-            FOREIGN KEY (contact_id) REFERENCES contacts (id) ON DELETE CASCADE,
-            FOREIGN KEY (tag_id) REFERENCES tags (id) ON DELETE CASCADE
-        );
-        """)
-
-        # Create special occasions table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS special_occasions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            contact_id INTEGER NOT NULL,
-            name TEXT NOT NULL,
-            date DATE NOT NULL,
-            FOREIGN KEY (contact_id) REFERENCES contacts (id) ON DELETE CASCADE
-        );
-        """)
-
-        # Create gifts table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS gifts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            contact_id INTEGER NOT NULL,
-            occasion_id INTEGER,
-            description TEXT NOT NULL,
-            direction TEXT NOT NULL, -- "given" or "received"
-            date DATE,
-            FOREIGN KEY (contact_id) REFERENCES contacts (id) ON DELETE CASCADE,
-            FOREIGN KEY (occasion_id) REFERENCES special_occasions (id) ON DELETE SET NULL
-        );
-        """)
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'contacts_fts'")
+        fts_is_new = cursor.fetchone() is None
 
-        conn.commit()
+        conn.executescript(_SCHEMA_SQL)
+
+        if fts_is_new:
+            # Index any contacts that were added before the table existed
+            cursor.execute("INSERT INTO contacts_fts (contacts_fts) VALUES ('rebuild')")
+            conn.commit()
+
+        # Gather query planner statistics once; the PRAGMA optimize in
+        # close_db keeps them up to date from then on.
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        if not cursor.fetchone():
+            cursor.execute("ANALYZE")
+            conn.commit()
 
 
 def migrate_db():
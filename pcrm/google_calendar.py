@@ -10,6 +10,12 @@ from googleapiclient.errors import HttpError
 # If modifying these scopes, delete the file token.json.
 SCOPES = ["https://www.googleapis.com/auth/calendar.events"]
 
+# The service and its credentials are kept for the rest of the session, so
+# creating several events doesn't re-read token.json and rebuild the client
+# each time.
+_service = None
+_creds = None
+
 
 def get_calendar_service():
     """
@@ -21,7 +27,13 @@ def get_calendar_service():
 
     It requires a `credentials.json` file from a Google Cloud project with the
     OAuth 2.0 Client ID enabled. The user must provide this file.
+
+    The service is cached and reused for as long as its credentials are valid.
     """
+    global _service, _creds
+    if _service is not None and _creds.valid:
+        return _service
+
     creds = None
     # The file token.json stores the user's access and refresh tokens.
     if os.path.exists("token.json"):
@@ -56,26 +68,20 @@ def get_calendar_service():
             token.write(creds.to_json())
 
     try:
-        service = build("calendar", "v3", credentials=creds)
+        # Use the discovery document bundled with the library instead of
+        # fetching it over HTTP
+        service = build("calendar", "v3", credentials=creds, static_discovery=True)
+        _service, _creds = service, creds
         return service
     except HttpError as error:
         print(f"An error occurred building the service: {error}")
         return None
 
-def create_calendar_event(summary, start_time, end_time):
-    """
-    Creates an event on the user's primary Google Calendar.
-
-    Args:
-        summary (str): The title of the event.
-        start_time (datetime.datetime or datetime.date): The start time/date of the event.
-        end_time (datetime.datetime or datetime.date): The end time/date of the event.
-    """
-    service = get_calendar_service()
-    if not service:
-        print("Could not connect to Google Calendar. Event not created.")
-        return
+# Google's limit on requests in one batch call
+BATCH_LIMIT = 50
 
+def _build_event(summary, start_time, end_time):
+    """Builds the API request body for an event; see create_calendar_event for the arguments."""
     event = {'summary': summary}
     if isinstance(start_time, datetime.datetime):
         # It's a timed event
@@ -91,10 +97,55 @@ def create_calendar_event(summary, start_time, end_time):
         # It's an all-day event
         event['start'] = {'date': start_time.isoformat()}
         event['end'] = {'date': end_time.isoformat()}
+    return event
 
+def create_calendar_event(summary, start_time, end_time):
+    """
+    Creates an event on the user's primary Google Calendar.
+
+    Args:
+        summary (str): The title of the event.
+        start_time (datetime.datetime or datetime.date): The start time/date of the event.
+        end_time (datetime.datetime or datetime.date): The end time/date of the event.
+    """
+    service = get_calendar_service()
+    if not service:
+        print("Could not connect to Google Calendar. Event not created.")
+        return
+
+    event = _build_event(summary, start_time, end_time)
 
     try:
         created_event = service.events().insert(calendarId='primary', body=event).execute()
         print(f"Event created: {created_event.get('htmlLink')}")
     except HttpError as error:
         print(f"An error occurred creating the event: {error}")
+
+def create_calendar_events(events):
+    """
+    Creates several events on the user's primary Google Calendar, sending
+    up to BATCH_LIMIT of them in each HTTP request.
+
+    Args:
+        events (list): (summary, start_time, end_time) tuples, as taken by
+            create_calendar_event.
+    """
+    service = get_calendar_service()
+    if not service:
+        print("Could not connect to Google Calendar. Events not created.")
+        return
+
+    def report(request_id, created_event, exception):
+        if exception is not None:
+            print(f"An error occurred creating an event: {exception}")
+        else:
+            print(f"Event created: {created_event.get('htmlLink')}")
+
+    for i in range(0, len(events), BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=report)
+        for summary, start_time, end_time in events[i:i + BATCH_LIMIT]:
+            batch.add(service.events().insert(calendarId='primary', body=_build_event(summary, start_time, end_time)))
+        try:
+            batch.execute()
+        except HttpError as error:
+            print(f"An error occurred creating events: {error}")
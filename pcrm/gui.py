@@ -2,17 +2,157 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import datetime
 import csv
+import hashlib
+import json
+import math
+import queue
 import re
-import sqlite3
-from .database import get_db_connection
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from .database import get_db_connection, close_db
 from . import contacts
 from . import data_exporter, data_importer
+from .interactions import _INSERT_NOTE_SQL, _INSERT_REMINDER_SQL
+from .utils import parse_date
 from .google_calendar import create_calendar_event
 import networkx as nx
 import numpy as np
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+# The last graph layout, saved with a key for the graph's nodes and edges. The
+# spring layout is the slowest part of opening the graph tab, so it is reused
+# on startup as long as no contacts or relationships have changed since.
+GRAPH_LAYOUT_FILE = "graph_layout.json"
+
+# How often, in milliseconds, the Tk thread picks up results from worker threads
+_RESULT_POLL_MS = 50
+
+# Searches, filters and sorts whose contacts tree rows are kept in memory
+_CONTACT_ROWS_CACHE_SIZE = 64
+
+# SQL run from the dialogs and per-contact views. All of it goes through the
+# thread's long-lived connection, and keeping each statement's text in one place
+# means it is prepared once and then reused from the statement cache.
+_INSERT_OCCASION_SQL = "INSERT INTO special_occasions (contact_id, name, date) VALUES (?, ?, ?)"
+_INSERT_GIFT_SQL = "INSERT INTO gifts (contact_id, description, direction, date) VALUES (?, ?, ?, ?)"
+_SELECT_OCCASIONS_SQL = "SELECT id, name, date FROM special_occasions WHERE contact_id = ? ORDER BY date"
+_SELECT_GIFTS_SQL = "SELECT id, description, direction, date FROM gifts WHERE contact_id = ? ORDER BY date DESC"
+_SELECT_NOTES_SQL = "SELECT created_at, note_text FROM notes WHERE contact_id = ? ORDER BY created_at DESC"
+_SELECT_REMINDERS_SQL = "SELECT reminder_date, message FROM reminders WHERE contact_id = ? ORDER BY reminder_date ASC"
+_INSERT_TAG_SQL = "INSERT OR IGNORE INTO tags (name) VALUES (?)"
+_TAG_CONTACT_SQL = "INSERT OR IGNORE INTO contact_tags (contact_id, tag_id) SELECT ?, id FROM tags WHERE name = ?"
+# Everything the details window shows besides the contact row itself, as
+# (kind, value, value, sort key) rows. Each branch is an index lookup on
+# contact_id. Dates are formatted in SQL, since the DATE and TIMESTAMP
+# converters don't apply to the columns of a compound select.
+_SELECT_CONTACT_DETAILS_SQL = """
+    SELECT 'phone', phone_number, phone_type, id FROM phones WHERE contact_id = :id
+    UNION ALL
+    SELECT 'pet', name, NULL, id FROM pets WHERE contact_id = :id
+    UNION ALL
+    SELECT 'relationship', TRIM(c.first_name || ' ' || COALESCE(c.last_name, '')), r.relationship_type, r.id
+    FROM relationships r JOIN contacts c ON c.id = r.contact2_id WHERE r.contact1_id = :id
+    UNION ALL
+    SELECT 'relationship', TRIM(c.first_name || ' ' || COALESCE(c.last_name, '')), r.relationship_type, r.id
+    FROM relationships r JOIN contacts c ON c.id = r.contact1_id WHERE r.contact2_id = :id
+    UNION ALL
+    SELECT 'note', strftime('%Y-%m-%d %H:%M', created_at), note_text, created_at FROM notes WHERE contact_id = :id
+    UNION ALL
+    SELECT 'reminder', reminder_date, message, reminder_date FROM reminders WHERE contact_id = :id
+    UNION ALL
+    SELECT 'tag', t.name, NULL, t.name FROM contact_tags ct JOIN tags t ON t.id = ct.tag_id WHERE ct.contact_id = :id
+    ORDER BY 1, 4
+"""
+
+# The contacts tree query. Its rows are exactly the tree's values, with missing
+# values already turned into empty strings. Each contact's tags are gathered
+# by a subquery on its contact_tags rows, so there is no join to group back up.
+# The time known and last seen columns are worked out by SQLite from the day
+# numbers of the dates. Birthdays and the dates met go through iso_date() (see
+# database.sql_iso_date), which pads dates like 1990-2-3 the way the DATE
+# converter did and is NULL for anything that isn't a date.
+_CONTACT_COLUMNS_SQL = """
+    SELECT
+        c.id, c.first_name, COALESCE(c.last_name, ''), COALESCE(c.email, ''),
+        COALESCE(iso_date(c.birthday), c.birthday, ''),
+        COALESCE((SELECT GROUP_CONCAT(t.name) FROM contact_tags ct JOIN tags t ON t.id = ct.tag_id
+                  WHERE ct.contact_id = c.id), '') AS tags,
+        CASE
+            WHEN c.date_met IS NULL OR c.date_met = '' THEN 'N/A'
+            WHEN iso_date(c.date_met) IS NULL THEN 'Invalid date'
+            WHEN julianday(iso_date(c.date_met)) > julianday(:today) THEN 'Future date'
+            ELSE printf('%.2f years', (julianday(:today) - julianday(iso_date(c.date_met))) / 365.25)
+        END AS time_known,
+        CASE
+            WHEN julianday(date(c.last_contacted_at)) IS NULL THEN 'N/A'
+            ELSE printf('%d days ago', julianday(:today) - julianday(date(c.last_contacted_at)))
+        END AS last_seen
+"""
+_SELECT_CONTACTS_SQL = _CONTACT_COLUMNS_SQL + " FROM contacts c"
+# With only a tag filter, the query starts from the tag instead: its
+# contact_tags rows (the covering index on (tag_id, contact_id)) give the
+# contacts to read by id, so contacts without the tag are never looked at.
+_SELECT_TAGGED_CONTACTS_SQL = _CONTACT_COLUMNS_SQL + """
+    FROM tags t2
+    JOIN contact_tags ct2 ON ct2.tag_id = t2.id
+    JOIN contacts c ON c.id = ct2.contact_id
+    WHERE t2.name = :tag
+"""
+# Contacts that HAVE the tag, when searching as well. EXISTS checks each contact with a lookup on the
+# contact_tags primary key and the unique tag name, stopping at the first match.
+_CONTACTS_TAG_FILTER = "EXISTS (SELECT 1 FROM contact_tags ct2 JOIN tags t2 ON t2.id = ct2.tag_id WHERE ct2.contact_id = c.id AND t2.name = :tag)"
+# Contacts matching the search words, looked up in the full-text index rather
+# than by scanning every contact with LIKE
+_CONTACTS_SEARCH_FILTER = "c.id IN (SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH :search)"
+# The contacts query for each combination of (tag filter, search), built once
+_CONTACTS_QUERIES = {
+    (False, False): _SELECT_CONTACTS_SQL,
+    (True, False): _SELECT_TAGGED_CONTACTS_SQL,
+    (False, True): _SELECT_CONTACTS_SQL + " WHERE " + _CONTACTS_SEARCH_FILTER,
+    (True, True): _SELECT_CONTACTS_SQL + " WHERE " + _CONTACTS_TAG_FILTER + " AND " + _CONTACTS_SEARCH_FILTER,
+}
+# The dashboard's overdue reminders (0), upcoming reminders (1) and contacts
+# not seen for a while (2). Dates go through substr so they come back as text
+# in every branch; the DATE converter of the first branch's column would
+# otherwise be applied to the names in the third.
+_SELECT_DASHBOARD_SQL = """
+    SELECT 0, substr(r.reminder_date, 1, 10), c.first_name || ' ' || COALESCE(c.last_name, ''), r.message, substr(r.reminder_date, 1, 10)
+    FROM reminders r JOIN contacts c ON r.contact_id = c.id
+    WHERE r.reminder_date < :today
+    UNION ALL
+    SELECT 1, substr(r.reminder_date, 1, 10), c.first_name || ' ' || COALESCE(c.last_name, ''), r.message, substr(r.reminder_date, 1, 10)
+    FROM reminders r JOIN contacts c ON r.contact_id = c.id
+    WHERE r.reminder_date >= :today AND r.reminder_date <= :next_week
+    UNION ALL
+    SELECT 2, first_name || ' ' || COALESCE(last_name, ''), substr(last_contacted_at, 1, 10), NULL, last_contacted_at
+    FROM contacts
+    WHERE last_contacted_at < :threshold
+    ORDER BY 1, 5
+"""
+
+# How close (in graph layout units) a click must be to a node to pick it
+_NODE_HIT_RADIUS = 0.1
+
+# Contacts tree column -> what it is sorted by
+_CONTACT_SORT_COLUMNS = {
+    "ID": "c.id", "First Name": "c.first_name", "Last Name": "c.last_name",
+    "Email": "c.email", "Birthday": "c.birthday", "Tags": "tags",
+    "Time Known": "c.date_met", "Last Seen": "c.last_contacted_at"
+}
+
+
+def _fmt_date(value, default='N/A'):
+    """Formats a date or datetime from the database as YYYY-MM-DD, or returns default if there is none."""
+    if not value:
+        return default
+    if isinstance(value, datetime.date): # datetimes too
+        return value.strftime('%Y-%m-%d')
+    return str(value)
+
 
 class App(tk.Tk):
     def __init__(self):
@@ -22,6 +162,38 @@ class App(tk.Tk):
         self._dragged_node = None
         self._sort_column = "first_name"
         self._sort_direction = "asc"
+        # Name -> id map behind the contact comboboxes, and id -> name for every
+        # contact. They are only rebuilt when contacts have been added, edited,
+        # deleted or imported since last time.
+        self.contact_map = None
+        self.contact_names_by_id = {}
+        self._contacts_dirty = True
+        # Contact comboboxes on the tabs that have been built so far
+        self._contact_combos = []
+        # Buttons that change data, which are disabled while an import holds
+        # the database; see _add_write_button
+        self._write_buttons = []
+        self._importing = False
+        # Pending search from the search box, see _on_search_key
+        self._search_after_id = None
+        # Views waiting to be refreshed, see _queue_refresh
+        self._pending_refreshes = set()
+        self._refresh_scheduled = False
+        # Queries for the contacts tree and dashboard run on this worker rather
+        # than the Tk thread; see _run_in_background. With one worker, requests
+        # run in order and on_close can close its connection.
+        self._db_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pcrm-db")
+        self._query_generations = {} # View name -> number of its latest request
+        # Contacts tree rows by query, most recently used last. Only the worker
+        # reads or changes it; see _fetch_contact_rows.
+        self._contact_rows_cache = OrderedDict()
+        self._contact_rows_version = 0 # Bumped whenever the cached rows are cleared
+        self._closing = False
+        # Callbacks that worker threads want run on the Tk thread. Tk can only be
+        # called from the thread that created it, so workers put (callback, args)
+        # here and _poll_results runs them.
+        self._results = queue.Queue()
+        self._poll_after_id = self.after(_RESULT_POLL_MS, self._poll_results)
 
         # Create the tab control
         self.notebook = ttk.Notebook(self)
@@ -45,20 +217,138 @@ class App(tk.Tk):
         self.notebook.add(self.data_tab, text="Data Management")
 
         self.notebook.pack(expand=True, fill="both")
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
-        # 1. Set up all UI elements first
-        self.setup_dashboard_tab()
-        self.setup_contacts_tab()
-        self.setup_interactions_tab()
-        self.setup_occasions_tab()
-        self.setup_relationships_tab()
-        self.setup_graph_tab()
-        self.setup_data_tab()
-
-        # 2. Then, populate the UI with data
-        self.populate_dashboard()
-        self.populate_contacts_tree()
-        self.populate_relationship_graph()
+        # The relationship graph and its layout live outside the graph tab, so
+        # relationship edits and exports work before the tab has been opened.
+        self.G = nx.Graph()
+        self.graph_pos = None # To store node positions
+        # Nodes bucketed by grid cell for hit-testing, and the graph_pos dict
+        # the buckets were built from; see _node_grid
+        self._pos_grid = None
+        self._pos_grid_source = None
+
+        # Each tab's widgets are only set up, and its data loaded, the first time
+        # it is selected. Only the dashboard, which is shown first, is built now.
+        self._tab_builders = {
+            str(self.dashboard_tab): (self.setup_dashboard_tab, self.populate_dashboard),
+            str(self.contacts_tab): (self.setup_contacts_tab, self.populate_contacts_tree),
+            str(self.interactions_tab): (self.setup_interactions_tab, None),
+            str(self.occasions_tab): (self.setup_occasions_tab, None),
+            str(self.relationships_tab): (self.setup_relationships_tab, None),
+            str(self.graph_tab): (self.setup_graph_tab, self.populate_relationship_graph),
+            str(self.data_tab): (self.setup_data_tab, None),
+        }
+        self._built_tabs = set()
+        self._build_tab(str(self.dashboard_tab))
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _build_tab(self, tab_name):
+        """Sets up and populates a tab (by widget name), unless it has been already."""
+        if tab_name in self._built_tabs:
+            return
+        self._built_tabs.add(tab_name)
+        setup, populate = self._tab_builders[tab_name]
+        setup()
+        if populate:
+            populate()
+
+    def _tab_is_built(self, tab):
+        return str(tab) in self._built_tabs
+
+    def _on_tab_changed(self, event=None):
+        """Builds the newly selected tab the first time it is shown."""
+        self._build_tab(self.notebook.select())
+
+    def on_close(self):
+        """Closes the database connections before the window goes away."""
+        # Keep the layout, including any nodes the user has dragged, for next time
+        if self.graph_pos and self._tab_is_built(self.graph_tab):
+            self._save_layout()
+        self._closing = True # Queued background queries are skipped
+        self.after_cancel(self._poll_after_id)
+        self._db_pool.submit(close_db) # The worker's own connection
+        self._db_pool.shutdown(wait=True)
+        close_db()
+        self.destroy()
+
+    def _run_in_background(self, view, query, apply, *args):
+        """
+        Runs query(*args) on the database worker thread and hands its result to
+        apply(result) on the Tk thread, so slow queries don't freeze the window.
+        Only the latest request for each view is applied: earlier ones that
+        haven't started yet are skipped, and results that arrive late are dropped.
+        """
+        generation = self._query_generations.get(view, 0) + 1
+        self._query_generations[view] = generation
+
+        def is_current():
+            return not self._closing and self._query_generations.get(view) == generation
+
+        def run():
+            return query(*args) if is_current() else None
+
+        def finish(future):
+            if is_current():
+                apply(future.result())
+
+        def done(future):
+            # Called on the worker thread, so the result goes through the queue
+            if is_current():
+                self._results.put((finish, (future,)))
+
+        self._db_pool.submit(run).add_done_callback(done)
+
+    def _poll_results(self):
+        """Runs the callbacks worker threads have queued, then checks again shortly."""
+        try:
+            while True:
+                try:
+                    callback, args = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                # One failing callback (e.g. a query that raised on the worker)
+                # is reported like any other Tk callback error, and the rest
+                # still run
+                try:
+                    callback(*args)
+                except Exception:
+                    self.report_callback_exception(*sys.exc_info())
+        finally:
+            if not self._closing:
+                self._poll_after_id = self.after(_RESULT_POLL_MS, self._poll_results)
+
+    # Views that can be queued for refreshing, in the order they are refreshed,
+    # with the tab each one lives on. Views on tabs that haven't been built yet
+    # are skipped; they are populated when the tab is first shown. The contact
+    # combos come first, since the interactions view looks up the selected
+    # contact in contact_map.
+    _REFRESHERS = (
+        ("contacts_tree", "populate_contacts_tree", "contacts_tab"),
+        ("contact_combos", "_refresh_contact_combos", None),
+        ("dashboard", "populate_dashboard", "dashboard_tab"),
+        ("interactions", "populate_interaction_data", "interactions_tab"),
+        ("graph", "populate_relationship_graph", "graph_tab"),
+    )
+
+    def _queue_refresh(self, *names):
+        """
+        Queues the named views to be refreshed once Tk is idle. Requests made
+        before then are merged, so a chain of changes refreshes each view once.
+        """
+        self._pending_refreshes.update(names)
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            self.after_idle(self._flush_refreshes)
+
+    def _flush_refreshes(self):
+        """Refreshes every view queued by _queue_refresh."""
+        pending = self._pending_refreshes
+        self._pending_refreshes = set()
+        self._refresh_scheduled = False
+        for name, method, tab in self._REFRESHERS:
+            if name in pending and (tab is None or self._tab_is_built(getattr(self, tab))):
+                getattr(self, method)()
 
     def setup_relationships_tab(self):
         """Sets up the widgets for the relationship management tab."""
@@ -74,12 +364,14 @@ class App(tk.Tk):
         self.rel_contact1_combo = ttk.Combobox(add_frame, state="readonly", width=30)
         self.rel_contact1_combo.grid(row=0, column=1, padx=5, pady=5)
         self.rel_contact1_combo.bind("<<ComboboxSelected>>", self.populate_relationships_tree)
+        self._add_contact_combo(self.rel_contact1_combo)
 
 
         # Contact 2
         ttk.Label(add_frame, text="Contact 2:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
         self.rel_contact2_combo = ttk.Combobox(add_frame, state="readonly", width=30)
         self.rel_contact2_combo.grid(row=1, column=1, padx=5, pady=5)
+        self._add_contact_combo(self.rel_contact2_combo)
 
         # Relationship Type
         ttk.Label(add_frame, text="Relationship is:").grid(row=0, column=2, padx=5, pady=5, sticky="w")
@@ -87,8 +379,8 @@ class App(tk.Tk):
         ttk.Entry(add_frame, textvariable=self.rel_type_var, width=25).grid(row=0, column=3, padx=5, pady=5)
 
         # Action Buttons
-        ttk.Button(add_frame, text="Add Relationship", command=self.add_relationship).grid(row=1, column=3, padx=5, pady=5, sticky="e")
-        ttk.Button(add_frame, text="Remove Relationship", command=self.remove_relationship).grid(row=1, column=2, padx=5, pady=5, sticky="e")
+        self._add_write_button(ttk.Button(add_frame, text="Add Relationship", command=self.add_relationship)).grid(row=1, column=3, padx=5, pady=5, sticky="e")
+        self._add_write_button(ttk.Button(add_frame, text="Remove Relationship", command=self.remove_relationship)).grid(row=1, column=2, padx=5, pady=5, sticky="e")
 
 
         # --- Bottom frame for displaying existing relationships ---
@@ -98,18 +390,12 @@ class App(tk.Tk):
 
     def populate_relationships_tree(self, event=None):
         """Populates the relationships tree for the selected contact."""
-        for i in self.relationships_tree.get_children():
-            self.relationships_tree.delete(i)
-
         selected_name = self.rel_contact1_combo.get()
-        if not selected_name: return
-        contact_id = self.contact_map.get(selected_name)
-        if not contact_id: return
+        contact_id = self.contact_map.get(selected_name) if selected_name else None
 
-        relationships = contacts.get_relationships_for_contact(contact_id)
-        for rel in relationships:
-            related_contact_name = f"{rel['first_name']} {rel['last_name'] or ''}"
-            self.relationships_tree.insert("", "end", values=(related_contact_name, rel['relationship_type']))
+        relationships = contacts.get_relationships_for_contact(contact_id) if contact_id else []
+        self._fill_treeview(self.relationships_tree,
+                            ((rel['display_name'], rel['relationship_type']) for rel in relationships))
 
     def add_relationship(self):
         """Adds a relationship between the two selected contacts."""
@@ -132,6 +418,12 @@ class App(tk.Tk):
         messagebox.showinfo("Success", f"Relationship between {name1} and {name2} added.")
         self.populate_relationships_tree() # Refresh the view
 
+        # Update the graph in place rather than rebuilding it. An existing edge
+        # means the insert was rejected as a duplicate, so its label stays.
+        if contact1_id in self.G and contact2_id in self.G and not self.G.has_edge(contact1_id, contact2_id):
+            self.G.add_edge(contact1_id, contact2_id, label=rel_type)
+            self._redraw_graph()
+
     def remove_relationship(self):
         """Removes the relationship between the two selected contacts."""
         name1 = self.rel_contact1_combo.get()
@@ -148,17 +440,25 @@ class App(tk.Tk):
         messagebox.showinfo("Success", f"Relationship between {name1} and {name2} removed.")
         self.populate_relationships_tree() # Refresh the view
 
+        if self.G.has_edge(contact1_id, contact2_id):
+            self.G.remove_edge(contact1_id, contact2_id)
+            self._redraw_graph()
+
     def setup_data_tab(self):
         """Sets up the widgets for the data management tab."""
         data_frame = ttk.Frame(self.data_tab, padding="20")
         data_frame.pack(fill="both", expand=True)
 
-        import_button = ttk.Button(data_frame, text="Import from JSON...", command=self.import_data, style="Accent.TButton")
-        import_button.pack(pady=10)
+        self.import_button = self._add_write_button(
+            ttk.Button(data_frame, text="Import from JSON...", command=self.import_data, style="Accent.TButton"))
+        self.import_button.pack(pady=10)
 
         export_button = ttk.Button(data_frame, text="Export to JSON...", command=self.export_data)
         export_button.pack(pady=10)
 
+        # Shown while an import runs in the background
+        self.import_progress = ttk.Progressbar(data_frame, mode="indeterminate", length=300)
+
         # Add a style for the accent button
         style = ttk.Style(self)
         style.configure("Accent.TButton", font=("Helvetica", 10, "bold"))
@@ -183,25 +483,51 @@ class App(tk.Tk):
         if not messagebox.askyesno("Confirm Import", "This will replace all current data. Are you sure you want to proceed?"):
             return
 
-        try:
-            graph_layout = data_importer.import_data_from_json(filepath)
-
-            # Restore the graph layout
-            if graph_layout:
-                self.graph_pos = {int(k): np.array(v) for k, v in graph_layout.items()}
+        # Run the import on a worker thread so the window keeps responding. The
+        # worker gets its own database connection (they are per-thread), and
+        # hands the result back to the Tk thread through _results.
+        def worker():
+            try:
+                graph_layout = data_importer.import_data_from_json(filepath)
+            except Exception as e:
+                self._results.put((self._import_failed, (e,)))
             else:
-                self.graph_pos = None # Reset layout if not in file
+                self._results.put((self._import_finished, (graph_layout,)))
+            finally:
+                close_db() # The thread's own connection
+
+        self._set_importing(True)
+        self.import_progress.pack(pady=10)
+        self.import_progress.start()
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _end_import(self):
+        """Hides the import progress bar and re-enables the buttons that change data."""
+        self.import_progress.stop()
+        self.import_progress.pack_forget()
+        self._set_importing(False)
+
+    def _import_finished(self, graph_layout):
+        """Runs on the Tk thread once a background import has succeeded."""
+        self._end_import()
+
+        # Restore the graph layout
+        if graph_layout:
+            self.graph_pos = {int(k): np.array(v) for k, v in graph_layout.items()}
+        else:
+            self.graph_pos = None # Reset layout if not in file
 
-            messagebox.showinfo("Import Successful", "Successfully imported data. Refreshing application...")
+        messagebox.showinfo("Import Successful", "Successfully imported data. Refreshing application...")
 
-            # Refresh all views to show the new data
+        # Refresh all views to show the new data
+        self._contacts_changed()
+        if self._tab_is_built(self.contacts_tab):
             self.populate_contacts_tree(clear_filters=True)
-            self.populate_relationship_graph()
-            self.populate_dashboard()
-            self._refresh_contact_combos()
 
-        except Exception as e:
-            messagebox.showerror("Import Failed", f"An error occurred during import: {e}")
+    def _import_failed(self, error):
+        """Runs on the Tk thread if a background import raised an error."""
+        self._end_import()
+        messagebox.showerror("Import Failed", f"An error occurred during import: {error}")
 
 
     def setup_occasions_tab(self):
@@ -217,12 +543,13 @@ class App(tk.Tk):
         self.occasion_contact_combo.pack(side="left", fill="x", expand=True)
         # We will populate this combobox along with the interactions one
         self.occasion_contact_combo.bind("<<ComboboxSelected>>", self.populate_occasion_data)
+        self._add_contact_combo(self.occasion_contact_combo)
 
         # Action buttons
         action_frame = ttk.Frame(occasions_frame)
         action_frame.pack(fill="x", pady=5)
-        ttk.Button(action_frame, text="Add Occasion", command=self.add_occasion_window).pack(side="left", padx=5)
-        ttk.Button(action_frame, text="Add Gift", command=self.add_gift_window).pack(side="left", padx=5)
+        self._add_write_button(ttk.Button(action_frame, text="Add Occasion", command=self.add_occasion_window)).pack(side="left", padx=5)
+        self._add_write_button(ttk.Button(action_frame, text="Add Gift", command=self.add_gift_window)).pack(side="left", padx=5)
 
         # Data display
         data_frame = ttk.Frame(occasions_frame)
@@ -252,13 +579,14 @@ class App(tk.Tk):
         self.interaction_contact_combo = ttk.Combobox(top_frame, state="readonly")
         self.interaction_contact_combo.pack(side="left", fill="x", expand=True)
         self.interaction_contact_combo.bind("<<ComboboxSelected>>", self.populate_interaction_data)
+        self._add_contact_combo(self.interaction_contact_combo)
 
         # Action buttons
         action_frame = ttk.Frame(interactions_frame)
         action_frame.pack(fill="x", pady=5)
-        ttk.Button(action_frame, text="Add Note", command=self.add_note_window).pack(side="left", padx=5)
-        ttk.Button(action_frame, text="Add Reminder", command=self.add_reminder_window).pack(side="left", padx=5)
-        ttk.Button(action_frame, text="Log Interaction", command=self.log_interaction_window).pack(side="left", padx=5)
+        self._add_write_button(ttk.Button(action_frame, text="Add Note", command=self.add_note_window)).pack(side="left", padx=5)
+        self._add_write_button(ttk.Button(action_frame, text="Add Reminder", command=self.add_reminder_window)).pack(side="left", padx=5)
+        self._add_write_button(ttk.Button(action_frame, text="Log Interaction", command=self.log_interaction_window)).pack(side="left", padx=5)
 
         # Data display
         data_frame = ttk.Frame(interactions_frame)
@@ -275,18 +603,58 @@ class App(tk.Tk):
         self.reminders_tree.column("Message", width=300)
 
     def _refresh_contact_combos(self):
-        """Refreshes the list of contacts in all contact selection comboboxes."""
+        """
+        Refreshes the contact maps and the list of contacts in all contact
+        selection comboboxes, if contacts have changed since the last refresh.
+        """
+        if not self._contacts_dirty and self.contact_map is not None:
+            return
+
+        # Both maps are filled in one pass over the cursor, with the names
+        # already joined by SQLite
+        contact_map, names_by_id = {}, {}
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT id, first_name, last_name FROM contacts ORDER BY first_name, last_name")
-            contacts = cursor.fetchall()
-
-        self.contact_map = {f"{c['first_name']} {c['last_name'] or ''}": c['id'] for c in contacts}
-        contact_names = list(self.contact_map.keys())
-        self.interaction_contact_combo['values'] = contact_names
-        self.occasion_contact_combo['values'] = contact_names
-        self.rel_contact1_combo['values'] = contact_names
-        self.rel_contact2_combo['values'] = contact_names
+            cursor.row_factory = None
+            cursor.execute("""
+                SELECT TRIM(first_name || ' ' || COALESCE(last_name, '')), id
+                FROM contacts ORDER BY first_name, last_name
+            """)
+            for name, contact_id in cursor:
+                contact_map[name] = contact_id
+                names_by_id[contact_id] = name
+        self.contact_map, self.contact_names_by_id = contact_map, names_by_id
+
+        self.contact_names = contact_names = list(self.contact_map.keys())
+        for combo in self._contact_combos:
+            combo['values'] = contact_names
+        self._contacts_dirty = False
+
+    def _add_write_button(self, button):
+        """
+        Registers a button that writes to the database. A background import
+        keeps the database locked until it finishes, so these are disabled
+        while one runs rather than letting a click wait on the lock and fail.
+        Returns the button.
+        """
+        self._write_buttons.append(button)
+        if self._importing:
+            button.state(["disabled"])
+        return button
+
+    def _set_importing(self, importing):
+        """Disables the write buttons while an import runs, and re-enables them after."""
+        self._importing = importing
+        # Buttons in dialogs that have since been closed are dropped
+        self._write_buttons = [button for button in self._write_buttons if button.winfo_exists()]
+        for button in self._write_buttons:
+            button.state(["disabled"] if importing else ["!disabled"])
+
+    def _add_contact_combo(self, combo):
+        """Fills a newly built contact combobox and keeps it refreshed from then on."""
+        self._contact_combos.append(combo)
+        self._refresh_contact_combos()
+        combo['values'] = self.contact_names
 
     def populate_occasion_data(self, event=None):
         """Populates the occasions and gifts trees for the selected contact."""
@@ -295,20 +663,16 @@ class App(tk.Tk):
         contact_id = self.contact_map.get(selected_name)
         if not contact_id: return
 
-        # Clear trees
-        for i in self.occasions_tree.get_children(): self.occasions_tree.delete(i)
-        for i in self.gifts_tree.get_children(): self.gifts_tree.delete(i)
-
         with get_db_connection() as conn:
             cursor = conn.cursor()
             # Populate occasions
-            cursor.execute("SELECT id, name, date FROM special_occasions WHERE contact_id = ? ORDER BY date", (contact_id,))
-            for occ in cursor.fetchall():
-                self.occasions_tree.insert("", "end", values=(occ['id'], occ['name'], occ['date']))
+            cursor.execute(_SELECT_OCCASIONS_SQL, (contact_id,))
+            self._fill_treeview(self.occasions_tree,
+                                ((occ['id'], occ['name'], occ['date']) for occ in cursor))
             # Populate gifts
-            cursor.execute("SELECT id, description, direction, date FROM gifts WHERE contact_id = ? ORDER BY date DESC", (contact_id,))
-            for gift in cursor.fetchall():
-                self.gifts_tree.insert("", "end", values=(gift['id'], gift['description'], gift['direction'], gift['date']))
+            cursor.execute(_SELECT_GIFTS_SQL, (contact_id,))
+            self._fill_treeview(self.gifts_tree,
+                                ((gift['id'], gift['description'], gift['direction'], gift['date']) for gift in cursor))
 
     def _get_selected_occasion_contact_id(self):
         """Helper to get the currently selected contact's ID from the occasion combobox."""
@@ -351,20 +715,20 @@ class App(tk.Tk):
                 messagebox.showwarning("Input Required", "Name and date are required.")
                 return
             try:
-                occasion_date_obj = datetime.datetime.strptime(date_str, '%Y-%m-%d')
+                occasion_date = parse_date(date_str)
             except ValueError:
                 messagebox.showerror("Invalid Format", "Date must be in YYYY-MM-DD format.")
                 return
 
             with get_db_connection() as conn:
-                conn.cursor().execute("INSERT INTO special_occasions (contact_id, name, date) VALUES (?, ?, ?)", (contact_id, name, date_str))
+                conn.execute(_INSERT_OCCASION_SQL, (contact_id, name, date_str))
                 conn.commit()
 
             if gcal_var.get():
                 try:
                     contact_name = self.occasion_contact_combo.get()
                     summary = f"{name} for {contact_name}"
-                    start_date = occasion_date_obj.date()
+                    start_date = occasion_date
                     end_date = start_date + datetime.timedelta(days=1)
                     create_calendar_event(summary, start_date, end_date)
                     messagebox.showinfo("Google Calendar", "Event created successfully (check console for link).", parent=dialog)
@@ -402,11 +766,11 @@ class App(tk.Tk):
                 messagebox.showwarning("Input Required", "Description is required.")
                 return
             if date_str:
-                try: datetime.datetime.strptime(date_str, '%Y-%m-%d')
+                try: parse_date(date_str)
                 except ValueError: messagebox.showerror("Invalid Format", "Date must be in YYYY-MM-DD format."); return
 
             with get_db_connection() as conn:
-                conn.cursor().execute("INSERT INTO gifts (contact_id, description, direction, date) VALUES (?, ?, ?, ?)", (contact_id, desc, direction, date_str))
+                conn.execute(_INSERT_GIFT_SQL, (contact_id, desc, direction, date_str))
                 conn.commit()
             self.populate_occasion_data()
             dialog.destroy()
@@ -424,23 +788,17 @@ class App(tk.Tk):
         if not contact_id:
             return
 
-        # Clear existing data
-        for i in self.notes_tree.get_children(): self.notes_tree.delete(i)
-        for i in self.reminders_tree.get_children(): self.reminders_tree.delete(i)
-
         # Populate notes
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT created_at, note_text FROM notes WHERE contact_id = ? ORDER BY created_at DESC", (contact_id,))
-            notes = cursor.fetchall()
-            for note in notes:
-                self.notes_tree.insert("", "end", values=(note['created_at'].strftime('%Y-%m-%d'), note['note_text']))
+            cursor.execute(_SELECT_NOTES_SQL, (contact_id,))
+            self._fill_treeview(self.notes_tree,
+                                ((note['created_at'].strftime('%Y-%m-%d'), note['note_text']) for note in cursor))
 
             # Populate reminders
-            cursor.execute("SELECT reminder_date, message FROM reminders WHERE contact_id = ? ORDER BY reminder_date ASC", (contact_id,))
-            reminders = cursor.fetchall()
-            for reminder in reminders:
-                self.reminders_tree.insert("", "end", values=(reminder['reminder_date'], reminder['message']))
+            cursor.execute(_SELECT_REMINDERS_SQL, (contact_id,))
+            self._fill_treeview(self.reminders_tree,
+                                ((reminder['reminder_date'], reminder['message']) for reminder in cursor))
 
     def _get_selected_interaction_contact_id(self):
         """Helper to get the currently selected contact's ID from the combobox."""
@@ -467,11 +825,11 @@ class App(tk.Tk):
 
     def _add_note_by_id(self, contact_id, message):
         with get_db_connection() as conn:
-            conn.cursor().execute("INSERT INTO notes (contact_id, note_text) VALUES (?, ?)", (contact_id, message))
+            conn.execute(_INSERT_NOTE_SQL, (contact_id, message))
             conn.commit()
         contacts._update_last_contacted(contact_id)
-        self.populate_interaction_data() # Refresh view
-        self.populate_dashboard() # Refresh dashboard
+        self._invalidate_contact_rows()
+        self._queue_refresh("interactions", "dashboard")
 
     def _log_interaction_by_id(self, contact_id, message):
         note = f"Logged interaction: {message}"
@@ -526,29 +884,29 @@ class App(tk.Tk):
                 return
 
             try:
-                reminder_date_obj = datetime.datetime.strptime(date_str, '%Y-%m-%d')
+                reminder_date = parse_date(date_str)
             except ValueError:
                 messagebox.showerror("Invalid Format", "Date must be in YYYY-MM-DD format.")
                 return
 
             with get_db_connection() as conn:
-                conn.cursor().execute("INSERT INTO reminders (contact_id, message, reminder_date) VALUES (?, ?, ?)", (contact_id, message, date_str))
+                conn.execute(_INSERT_REMINDER_SQL, (contact_id, message, date_str))
                 conn.commit()
             contacts._update_last_contacted(contact_id)
+            self._invalidate_contact_rows()
 
             if gcal_var.get():
                 try:
                     contact_name = self.interaction_contact_combo.get()
                     summary = f"Reminder for {contact_name}: {message}"
-                    start_time = reminder_date_obj.replace(hour=9, minute=0, second=0)
+                    start_time = datetime.datetime.combine(reminder_date, datetime.time(9, 0))
                     end_time = start_time + datetime.timedelta(hours=1)
                     create_calendar_event(summary, start_time, end_time)
                     messagebox.showinfo("Google Calendar", "Event created successfully (check console for link).", parent=dialog)
                 except Exception as e:
                     messagebox.showerror("Google Calendar Error", f"Could not create event: {e}", parent=dialog)
 
-            self.populate_interaction_data()
-            self.populate_dashboard()
+            self._queue_refresh("interactions", "dashboard")
             dialog.destroy()
 
         ttk.Button(dialog, text="Save", command=save).pack(pady=10)
@@ -589,18 +947,19 @@ class App(tk.Tk):
         toolbar = ttk.Frame(contacts_frame)
         toolbar.pack(fill="x", pady=5)
 
-        ttk.Button(toolbar, text="Add Contact", command=self.add_contact_window).pack(side="left", padx=5)
+        self._add_write_button(ttk.Button(toolbar, text="Add Contact", command=self.add_contact_window)).pack(side="left", padx=5)
         ttk.Button(toolbar, text="View Details", command=self.view_contact_window).pack(side="left", padx=5)
-        ttk.Button(toolbar, text="Edit Contact", command=self.edit_contact_window).pack(side="left", padx=5)
-        ttk.Button(toolbar, text="Delete Contact", command=self.delete_contact).pack(side="left", padx=5)
-        ttk.Button(toolbar, text="Manage Tags", command=self.manage_tags_window).pack(side="left", padx=5)
+        self._add_write_button(ttk.Button(toolbar, text="Edit Contact", command=self.edit_contact_window)).pack(side="left", padx=5)
+        self._add_write_button(ttk.Button(toolbar, text="Delete Contact", command=self.delete_contact)).pack(side="left", padx=5)
+        self._add_write_button(ttk.Button(toolbar, text="Manage Tags", command=self.manage_tags_window)).pack(side="left", padx=5)
 
         # Search functionality
         ttk.Label(toolbar, text="Search:").pack(side="left", padx=(20, 5))
         self.search_var = tk.StringVar()
         search_entry = ttk.Entry(toolbar, textvariable=self.search_var, width=25)
         search_entry.pack(side="left", padx=5)
-        search_entry.bind("<KeyRelease>", self.search_contacts)
+        search_entry.bind("<KeyRelease>", self._on_search_key)
+        search_entry.bind("<Return>", self.search_contacts)
 
         ttk.Button(toolbar, text="Advanced Search", command=self.advanced_search_window).pack(side="left", padx=5)
 
@@ -610,7 +969,7 @@ class App(tk.Tk):
         self.tag_filter_combo.pack(side="left", padx=5)
         self.tag_filter_combo.bind("<<ComboboxSelected>>", self.filter_by_tag)
 
-        ttk.Button(toolbar, text="Refresh List", command=lambda: self.populate_contacts_tree(clear_filters=True)).pack(side="right", padx=5)
+        ttk.Button(toolbar, text="Refresh List", command=self.refresh_contacts_list).pack(side="right", padx=5)
 
         # Contacts List
         tree_frame = ttk.Frame(contacts_frame)
@@ -626,10 +985,25 @@ class App(tk.Tk):
         self.contacts_tree.grid(row=0, column=0, sticky='nsew')
 
 
-        # Add scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.contacts_tree.yview)
-        self.contacts_tree.configure(yscroll=v_scrollbar.set)
-        v_scrollbar.grid(row=0, column=1, sticky='ns')
+        # Add scrollbars. The tree only ever holds the rows that fit in it (see
+        # _render_contacts_window), so the vertical scrollbar scrolls through
+        # _contacts_cache rather than the tree itself.
+        self._contacts_cache = []
+        self._contacts_first = 0
+        # The search, filter and sort the rows in _contacts_cache are for
+        self._contacts_query = None
+        # The focused and selected contact IDs (as tree item IDs), which are
+        # kept while their rows are scrolled out of the tree; see
+        # _render_contacts_window
+        self._contacts_focus = ""
+        self._contacts_selection = set()
+        self.contacts_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self._scroll_contacts)
+        self.contacts_scrollbar.grid(row=0, column=1, sticky='ns')
+        self.contacts_tree.bind("<Configure>", lambda e: self._render_contacts_window())
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.contacts_tree.bind(sequence, self._on_contacts_wheel)
+        self.contacts_tree.bind("<Up>", self._on_contacts_arrow)
+        self.contacts_tree.bind("<Down>", self._on_contacts_arrow)
 
         h_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.contacts_tree.xview)
         self.contacts_tree.configure(xscroll=h_scrollbar.set)
@@ -639,6 +1013,31 @@ class App(tk.Tk):
 
         self._refresh_tags_combo()
 
+    def refresh_contacts_list(self):
+        """Reloads the contact list and combobox names, e.g. after changes made outside the GUI."""
+        self._contacts_changed()
+        self.populate_contacts_tree(clear_filters=True)
+
+    def _contacts_changed(self):
+        """
+        Marks everything built from the contacts table as stale: the cached
+        contact rows and the name lists behind the comboboxes. The views that
+        show contact names (the dashboard and the graph) are queued for a
+        refresh here, after a write, rather than every time the contact list
+        is redrawn for a search, filter or sort.
+        """
+        self._invalidate_contact_rows()
+        self._contacts_dirty = True
+        self._queue_refresh("contact_combos", "dashboard", "graph")
+
+    def _invalidate_contact_rows(self):
+        """Clears the cached contacts tree rows after contacts, tags or last-seen dates change."""
+        # The cache belongs to the worker, so it is cleared there. The worker
+        # runs one job at a time, in order, so every fetch queued after this
+        # one sees the cleared cache.
+        self._db_pool.submit(self._contact_rows_cache.clear)
+        self._contact_rows_version += 1
+
     def on_contact_double_click(self, event):
         """Handler for double-clicking a contact in the tree."""
         region = self.contacts_tree.identify_region(event.x, event.y)
@@ -650,7 +1049,7 @@ class App(tk.Tk):
         with get_db_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT name FROM tags ORDER BY name")
-            tags = [row['name'] for row in cursor.fetchall()]
+            tags = [row['name'] for row in cursor]
         self.tag_filter_combo['values'] = ["All Contacts"] + tags
 
     def filter_by_tag(self, event=None):
@@ -661,8 +1060,24 @@ class App(tk.Tk):
         else:
             self.populate_contacts_tree(tag_filter=tag_name)
 
+    def _on_search_key(self, event=None):
+        """
+        Schedules a search for shortly after the last keystroke, cancelling the
+        one scheduled by the previous key, so a burst of typing runs one query.
+        Keys that can't change the text, such as arrows and Shift, are ignored.
+        """
+        if event is not None and not event.char and event.keysym not in ("BackSpace", "Delete"):
+            return
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(200, self.search_contacts)
+
     def search_contacts(self, event=None):
         """Filters the contacts treeview based on the search query."""
+        # Enter searches straight away, so drop the search a keystroke scheduled
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = None
         search_query = self.search_var.get().strip()
         self.populate_contacts_tree(search_query=search_query)
 
@@ -684,103 +1099,168 @@ class App(tk.Tk):
             search_query = None
             tag_filter = None
 
-        for i in self.contacts_tree.get_children():
-            self.contacts_tree.delete(i)
-
-        # Base query with all columns and tag aggregation
-        query = """
-            SELECT
-                c.id, c.first_name, c.last_name, c.chosen_name, c.pronouns, c.email, c.birthday, c.date_met, c.last_contacted_at,
-                GROUP_CONCAT(t.name) AS tags
-            FROM contacts c
-            LEFT JOIN contact_tags ct ON c.id = ct.contact_id
-            LEFT JOIN tags t ON ct.tag_id = t.id
+        # The rows are fetched on the worker thread. If the cache was cleared
+        # while they were being read, they may predate the change, so they are
+        # thrown away and fetched again (the clear runs on the worker before
+        # the new fetch, so it doesn't come from the cache).
+        key = (search_query or None, tag_filter or None,
+               self._sort_column, self._sort_direction, datetime.date.today())
+        version = self._contact_rows_version
+
+        def apply(rows):
+            if version != self._contact_rows_version:
+                self.populate_contacts_tree(search_query, tag_filter)
+                return
+            # A new search, filter or sort starts from the top; refreshing the
+            # same one (e.g. after a save) stays where the user was.
+            query = key[:4]
+            first = None if query == self._contacts_query else 0
+            self._contacts_query = query
+            self._contacts_cache = rows
+            self._render_contacts_window(first)
+        self._run_in_background("contacts_tree", self._fetch_contact_rows, apply, *key)
+
+    def _fetch_contact_rows(self, search_query, tag_filter, sort_column, sort_direction, today):
+        """
+        Returns the formatted rows for the contacts tree as a tuple, for one
+        search, tag filter and sort order. Results are cached, so going back to
+        an earlier search or filter doesn't query the database again. Anything
+        that changes contacts, their tags or when they were last contacted must
+        call _invalidate_contact_rows(). This runs on the database worker
+        thread (see populate_contacts_tree). today is part of the key so the
+        time known and last seen columns don't go stale overnight.
         """
-        params = []
-        where_clauses = []
+        key = (search_query, tag_filter, sort_column, sort_direction, today)
+        rows = self._contact_rows_cache.get(key)
+        if rows is not None:
+            self._contact_rows_cache.move_to_end(key)
+            return rows
 
+        params = {'today': today.isoformat()}
         if tag_filter:
-            # This is tricky with GROUP BY. We filter by contacts that HAVE the tag.
-            # We can't just add a WHERE clause here easily.
-            # A subquery is a clean way to handle this.
-            where_clauses.append("c.id IN (SELECT contact_id FROM contact_tags JOIN tags ON tags.id = contact_tags.tag_id WHERE tags.name = ?)")
-            params.append(tag_filter)
-
+            params['tag'] = tag_filter
         if search_query:
-            where_clauses.append("(c.first_name LIKE ? OR c.last_name LIKE ? OR c.email LIKE ?)")
-            params.extend([f"%{search_query}%", f"%{search_query}%", f"%{search_query}%"])
-
-        if where_clauses:
-            query += " WHERE " + " AND ".join(where_clauses)
-
-        # Map display names to database columns
-        sort_map = {
-            "ID": "c.id", "First Name": "c.first_name", "Last Name": "c.last_name",
-            "Email": "c.email", "Birthday": "c.birthday", "Tags": "tags",
-            "Time Known": "c.date_met", "Last Seen": "c.last_contacted_at"
-        }
-        sort_col_db = sort_map.get(self._sort_column, "c.first_name")
-
-
-        query += f" GROUP BY c.id ORDER BY {sort_col_db} {self._sort_direction.upper()}"
+            # Each word matches the start of a word in the name or email, so
+            # results narrow as the user types.
+            params['search'] = contacts._fts_column_query("{first_name last_name email}", search_query)
 
+        # The same filters and sort always give the same SQL text, so sqlite3
+        # reuses the prepared statement from its cache.
+        query = (_CONTACTS_QUERIES[bool(tag_filter), bool(search_query)]
+                 + f" ORDER BY {_CONTACT_SORT_COLUMNS.get(sort_column, 'c.first_name')} {sort_direction.upper()}")
 
         with get_db_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
             cursor.execute(query, params)
-            all_contacts = cursor.fetchall()
+            rows = tuple(cursor)
+
+        self._contact_rows_cache[key] = rows
+        if len(self._contact_rows_cache) > _CONTACT_ROWS_CACHE_SIZE:
+            self._contact_rows_cache.popitem(last=False)
+        return rows
+
+    def _contacts_window_size(self):
+        """Returns how many rows fit in the contacts tree at its current height."""
+        row_height = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+        height = self.contacts_tree.winfo_height()
+        if height <= 1:
+            # Not laid out yet; use the tree's requested height in rows
+            return int(self.contacts_tree.cget("height") or 10)
+        # One row's worth of the height goes to the headings
+        return max(1, height // row_height - 1)
+
+    def _render_contacts_window(self, first=None):
+        """
+        Fills the contacts tree with just the rows of _contacts_cache that fit
+        in it, starting at index first (or the current position), and moves the
+        scrollbar to match. Tk only has to manage a screenful of items, however
+        many contacts there are. Items are keyed by contact ID. Refilling the
+        tree drops its focus and selection, so they are recorded first and put
+        back on whichever of those contacts are still in view.
+        """
+        total = len(self._contacts_cache)
+        window = self._contacts_window_size()
+        if first is None:
+            first = self._contacts_first
+        first = max(0, min(first, total - window))
+        self._contacts_first = first
+
+        self._remember_contacts_selection()
+        tree = self.contacts_tree
+        self._fill_treeview(tree, self._contacts_cache[first:first + window], iid_index=0)
+        shown = set(tree.get_children())
+        if self._contacts_focus in shown:
+            tree.focus(self._contacts_focus)
+        selection = self._contacts_selection & shown
+        if selection:
+            tree.selection_set(*selection)
+        if total:
+            self.contacts_scrollbar.set(first / total, min(1.0, (first + window) / total))
+        else:
+            self.contacts_scrollbar.set(0.0, 1.0)
 
-        today = datetime.date.today()
-        for contact in all_contacts:
-            # Calculate time known
-            time_known_str = "N/A"
-            if contact['date_met']:
-                try:
-                    date_str = contact['date_met']
-                    # Handle both datetime objects and string dates
-                    if isinstance(date_str, datetime.datetime):
-                        date_met_obj = date_str.date()
-                    else:
-                        date_met_obj = datetime.datetime.strptime(str(date_str), '%Y-%m-%d').date()
-
-                    delta = today - date_met_obj
-                    if delta.days >= 0:
-                        years = delta.days / 365.25
-                        time_known_str = f"{years:.2f} years"
-                    else:
-                        time_known_str = "Future date"
-                except (ValueError, TypeError, AttributeError):
-                    # This can happen if date_met is not a valid date format
-                    time_known_str = "Invalid date"
-
-            # Calculate time since last seen
-            last_seen_str = "N/A"
-            if contact['last_contacted_at']:
-                try:
-                    # The database connection already converts this to a datetime object.
-                    last_contacted_obj = contact['last_contacted_at'].date()
-                    delta = today - last_contacted_obj
-                    last_seen_str = f"{delta.days} days ago"
-                except (ValueError, TypeError, AttributeError):
-                    # AttributeError can happen if last_contacted_at is not a datetime object
-                    pass # Keep as N/A
-
-            values = (
-                contact['id'],
-                contact['first_name'],
-                contact['last_name'] or '',
-                contact['email'] or '',
-                contact['birthday'] or '',
-                contact['tags'] or '',
-                time_known_str,
-                last_seen_str
-            )
-            self.contacts_tree.insert("", "end", values=values)
-
-        # Refresh dashboard as well since contact changes can affect it
-        if not search_query and not tag_filter: # Avoid refreshing during filters
-             self.populate_dashboard()
-             self._refresh_contact_combos()
+    def _remember_contacts_selection(self):
+        """
+        Updates the recorded focus and selection from the contacts tree. The
+        rows in the tree are taken from it as they are now; contacts scrolled
+        out of view keep their recorded state.
+        """
+        tree = self.contacts_tree
+        shown = set(tree.get_children())
+        focus = tree.focus()
+        if focus or self._contacts_focus in shown:
+            self._contacts_focus = focus
+        self._contacts_selection = (self._contacts_selection - shown) | set(tree.selection())
+
+    def _selected_contact_row(self):
+        """
+        Returns the contacts tree row (as in _contacts_cache) of the focused
+        contact, even if it is scrolled out of view, or None if there isn't one.
+        """
+        self._remember_contacts_selection()
+        if not self._contacts_focus:
+            return None
+        for row in self._contacts_cache:
+            if str(row[0]) == self._contacts_focus:
+                return row
+        return None
+
+    def _scroll_contacts(self, action, amount, unit=None):
+        """Scrollbar command for the contacts tree ('moveto' or 'scroll')."""
+        if action == "moveto":
+            first = int(float(amount) * len(self._contacts_cache))
+        else:
+            step = self._contacts_window_size() if unit == "pages" else 1
+            first = self._contacts_first + int(amount) * step
+        self._render_contacts_window(first)
+
+    def _on_contacts_wheel(self, event):
+        """Scrolls the contacts window with the mouse wheel."""
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_contacts("scroll", -3, "units")
+        else:
+            self._scroll_contacts("scroll", 3, "units")
+        return "break"
+
+    def _on_contacts_arrow(self, event):
+        """Scrolls the contacts window when the arrow keys move past its first or last row."""
+        children = self.contacts_tree.get_children()
+        focus = self.contacts_tree.focus()
+        if not children or focus not in children:
+            return None
+        step = 1 if event.keysym == "Down" else -1
+        index = children.index(focus) + step
+        if 0 <= index < len(children):
+            return None # Still inside the window, so let the tree handle it
+
+        self._scroll_contacts("scroll", step, "units")
+        children = self.contacts_tree.get_children()
+        if children:
+            edge = children[-1] if step > 0 else children[0]
+            self.contacts_tree.focus(edge)
+            self.contacts_tree.selection_set(edge)
+        return "break"
 
     def add_contact_window(self):
         """Opens a Toplevel window to add a new contact."""
@@ -788,12 +1268,12 @@ class App(tk.Tk):
 
     def edit_contact_window(self):
         """Opens a Toplevel window to edit the selected contact."""
-        selected_item = self.contacts_tree.focus()
-        if not selected_item:
+        selected_row = self._selected_contact_row()
+        if not selected_row:
             messagebox.showwarning("No Selection", "Please select a contact to edit.")
             return
 
-        contact_id = self.contacts_tree.item(selected_item)['values'][0]
+        contact_id = selected_row[0]
 
         with get_db_connection() as conn:
             cursor = conn.cursor()
@@ -807,12 +1287,11 @@ class App(tk.Tk):
 
     def delete_contact(self):
         """Deletes the selected contact."""
-        selected_item = self.contacts_tree.focus()
-        if not selected_item:
+        values = self._selected_contact_row()
+        if not values:
             messagebox.showwarning("No Selection", "Please select a contact to delete.")
             return
 
-        values = self.contacts_tree.item(selected_item)['values']
         contact_id = values[0]
         contact_name = f"{values[1]} {values[2] or ''}".strip()
 
@@ -824,9 +1303,11 @@ class App(tk.Tk):
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
                 conn.commit()
+            contacts.clear_name_cache()
+            self._contacts_changed()
 
             messagebox.showinfo("Success", f"Contact {contact_name} deleted.")
-            self.populate_contacts_tree()
+            self._queue_refresh("contacts_tree")
 
 
     def _open_contact_dialog(self, title, contact_data=None):
@@ -890,25 +1371,29 @@ class App(tk.Tk):
                               data['email'], data['birthday'], data['date_met'], data['how_met'],
                               data['favorite_color'], contact_data['id']))
                         conn.commit()
+                    contacts.clear_name_cache()
                 else: # Adding new contact
                     contacts.add_contact(**data)
+                self._contacts_changed()
 
-                self.populate_contacts_tree()
+                # Saving several contacts in a row rebuilds the tree once
+                self._queue_refresh("contacts_tree")
                 dialog.destroy()
 
             except Exception as e:
                 messagebox.showerror("Database Error", f"An error occurred: {e}")
 
-        save_button = ttk.Button(dialog, text="Save", command=save_contact)
+        # The dialog isn't modal, so it can still be open when an import starts
+        save_button = self._add_write_button(ttk.Button(dialog, text="Save", command=save_contact))
         save_button.grid(row=len(fields), column=0, columnspan=2, pady=10)
 
     def view_contact_window(self):
         """Opens a Toplevel window to display a comprehensive view of the selected contact."""
-        selected_item = self.contacts_tree.focus()
-        if not selected_item:
+        selected_row = self._selected_contact_row()
+        if not selected_row:
             messagebox.showwarning("No Selection", "Please select a contact to view.")
             return
-        contact_id = self.contacts_tree.item(selected_item)['values'][0]
+        contact_id = selected_row[0]
         self._view_contact_details_by_id(contact_id)
 
     def _view_contact_details_by_id(self, contact_id):
@@ -921,17 +1406,16 @@ class App(tk.Tk):
                 messagebox.showerror("Error", f"Could not retrieve contact with ID {contact_id}.")
                 return
 
-            # Fetch all related data
-            cursor.execute("SELECT phone_number, phone_type FROM phones WHERE contact_id = ?", (contact_id,))
-            phones = cursor.fetchall()
-            cursor.execute("SELECT name FROM pets WHERE contact_id = ?", (contact_id,))
-            pets = cursor.fetchall()
-            relationships = contacts.get_relationships_for_contact(contact_id)
-            cursor.execute("SELECT note_text, created_at FROM notes WHERE contact_id = ? ORDER BY created_at DESC", (contact_id,))
-            notes = cursor.fetchall()
-            cursor.execute("SELECT message, reminder_date FROM reminders WHERE contact_id = ? ORDER BY reminder_date ASC", (contact_id,))
-            reminders = cursor.fetchall()
-            tags = self._get_tags_for_contact(contact_id)
+            # Fetch all related data in one query, sorted into lists by kind
+            related = {kind: [] for kind in ('phone', 'pet', 'relationship', 'note', 'reminder', 'tag')}
+            cursor.row_factory = None
+            cursor.execute(_SELECT_CONTACT_DETAILS_SQL, {'id': contact_id})
+            for kind, first, second, _ in cursor:
+                related[kind].append((first, second))
+        phones, pets, relationships = related['phone'], related['pet'], related['relationship']
+        notes, reminders = related['note'], related['reminder']
+        notes.reverse() # Newest first
+        tags = [name for name, _ in related['tag']]
 
         # Create the window
         win = tk.Toplevel(self)
@@ -943,46 +1427,40 @@ class App(tk.Tk):
         details_frame = ttk.LabelFrame(win, text="Contact Details", padding="10")
         details_frame.pack(fill="x", padx=10, pady=5)
 
-        date_met_str = contact['date_met'].strftime('%Y-%m-%d') if isinstance(contact['date_met'], datetime.datetime) else (contact['date_met'] or 'N/A')
-        last_contacted_str = contact['last_contacted_at'].strftime('%Y-%m-%d') if contact['last_contacted_at'] else 'Never'
-
-        details_text = (
-            f"Name: {display_name}\n"
-            f"Chosen Name: {contact['chosen_name'] or 'N/A'}\n"
-            f"Pronouns: {contact['pronouns'] or 'N/A'}\n"
-            f"Email: {contact['email'] or 'N/A'}\n"
-            f"Birthday: {contact['birthday'] or 'N/A'}\n"
-            f"Date Met: {date_met_str}\n"
-            f"How Met: {contact['how_met'] or 'N/A'}\n"
-            f"Favorite Color: {contact['favorite_color'] or 'N/A'}\n"
-            f"Last Contacted: {last_contacted_str}\n"
-            f"Tags: {', '.join(tags) if tags else 'None'}"
-        )
+        details_text = "\n".join([
+            f"Name: {display_name}",
+            f"Chosen Name: {contact['chosen_name'] or 'N/A'}",
+            f"Pronouns: {contact['pronouns'] or 'N/A'}",
+            f"Email: {contact['email'] or 'N/A'}",
+            f"Birthday: {_fmt_date(contact['birthday'])}",
+            f"Date Met: {_fmt_date(contact['date_met'])}",
+            f"How Met: {contact['how_met'] or 'N/A'}",
+            f"Favorite Color: {contact['favorite_color'] or 'N/A'}",
+            f"Last Contacted: {_fmt_date(contact['last_contacted_at'], 'Never')}",
+            f"Tags: {', '.join(tags) if tags else 'None'}",
+        ])
         ttk.Label(details_frame, text=details_text, justify=tk.LEFT).pack(anchor="w")
 
         # Notebook for related data
         notebook = ttk.Notebook(win)
         notebook.pack(fill="both", expand=True, padx=10, pady=10)
 
-        # Helper to create a tab and treeview
+        # Helper to create a tab and treeview. Rows hold the values for columns in
+        # order, and may carry extra values after them.
         def create_tab_with_tree(tab_name, columns, data):
             tab = ttk.Frame(notebook)
             notebook.add(tab, text=tab_name)
             if data:
                 tree = self._create_treeview(tab, columns)
-                for row in data:
-                    tree.insert("", "end", values=[row[col] for col in columns])
+                width = len(columns)
+                self._fill_treeview(tree, (row[:width] for row in data))
             else:
                 ttk.Label(tab, text=f"No {tab_name.lower()} found.").pack(pady=20)
 
         if phones: create_tab_with_tree("Phones", ['phone_number', 'phone_type'], phones)
         if pets: create_tab_with_tree("Pets", ['name'], pets)
-        if relationships:
-            rel_data = [{'contact': f"{r['first_name']} {r['last_name'] or ''}", 'type': r['relationship_type']} for r in relationships]
-            create_tab_with_tree("Relationships", ['contact', 'type'], rel_data)
-        if notes:
-            formatted_notes = [{'created_at': n['created_at'].strftime('%Y-%m-%d %H:%M'), 'note_text': n['note_text']} for n in notes]
-            create_tab_with_tree("Notes", ['created_at', 'note_text'], formatted_notes)
+        if relationships: create_tab_with_tree("Relationships", ['contact', 'type'], relationships)
+        if notes: create_tab_with_tree("Notes", ['created_at', 'note_text'], notes)
         if reminders: create_tab_with_tree("Reminders", ['reminder_date', 'message'], reminders)
 
         win.transient(self); win.grab_set(); self.wait_window(win)
@@ -1042,19 +1520,18 @@ class App(tk.Tk):
         tree = self._create_treeview(tree_frame, columns)
         tree.column("ID", width=50, anchor="center")
 
-        for contact in results:
-            tree.insert("", "end", values=(contact['id'], contact['first_name'], contact['last_name'], contact['email']))
+        self._fill_treeview(tree, ((contact['id'], contact['first_name'], contact['last_name'], contact['email'])
+                                   for contact in results))
 
         results_window.transient(self); results_window.grab_set(); self.wait_window(results_window)
 
     def manage_tags_window(self):
         """Opens a Toplevel window to manage tags for the selected contact."""
-        selected_item = self.contacts_tree.focus()
-        if not selected_item:
+        values = self._selected_contact_row()
+        if not values:
             messagebox.showwarning("No Selection", "Please select a contact to manage their tags.")
             return
 
-        values = self.contacts_tree.item(selected_item)['values']
         contact_id = values[0]
         contact_name = f"{values[1]} {values[2] or ''}".strip()
 
@@ -1118,23 +1595,17 @@ class App(tk.Tk):
                 JOIN contact_tags ct ON t.id = ct.tag_id
                 WHERE ct.contact_id = ?
             """, (contact_id,))
-            return [row['name'] for row in cursor.fetchall()]
+            return [row['name'] for row in cursor]
 
     def _add_tag_to_contact_by_id(self, contact_id, tag_name):
-        try:
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT id FROM tags WHERE name = ?", (tag_name,))
-                tag = cursor.fetchone()
-                if not tag:
-                    cursor.execute("INSERT INTO tags (name) VALUES (?)", (tag_name,))
-                    tag_id = cursor.lastrowid
-                else:
-                    tag_id = tag['id']
-                cursor.execute("INSERT INTO contact_tags (contact_id, tag_id) VALUES (?, ?)", (contact_id, tag_id))
-                conn.commit()
-        except sqlite3.IntegrityError:
-            pass # Tag already exists for this contact, ignore.
+        # The tag is created if it's new, and the link skipped if the contact
+        # already has it; the unique tag name and contact_tags primary key
+        # make both inserts no-ops otherwise.
+        with get_db_connection() as conn:
+            conn.execute(_INSERT_TAG_SQL, (tag_name,))
+            conn.execute(_TAG_CONTACT_SQL, (contact_id, tag_name))
+            conn.commit()
+        self._invalidate_contact_rows()
 
     def _remove_tag_from_contact_by_id(self, contact_id, tag_name):
         with get_db_connection() as conn:
@@ -1144,6 +1615,7 @@ class App(tk.Tk):
             if tag:
                 cursor.execute("DELETE FROM contact_tags WHERE contact_id = ? AND tag_id = ?", (contact_id, tag['id']))
                 conn.commit()
+        self._invalidate_contact_rows()
 
     def _create_treeview(self, parent, columns, sort_callback=None):
         """Helper function to create a treeview, with optional sorting."""
@@ -1158,70 +1630,82 @@ class App(tk.Tk):
         tree.pack(fill="both", expand=True)
         return tree
 
+    @contextmanager
+    def _bulk_tree(self, tree):
+        """
+        Hides a treeview's headings and columns while it is being filled, so Tk
+        lays them out once afterwards rather than keeping them up to date on
+        every insert. The tree stays where it is in its parent's layout, so it
+        doesn't flicker or lose its scroll position.
+        """
+        show = tree.cget("show")
+        displaycolumns = tree.cget("displaycolumns")
+        tree.configure(show="", displaycolumns=())
+        try:
+            yield tree
+        finally:
+            tree.configure(show=show, displaycolumns=displaycolumns)
+
+    def _fill_treeview(self, tree, rows, iid_index=None):
+        """
+        Replaces the contents of a treeview with rows, an iterable of value tuples.
+        All existing items are removed with a single delete call rather than one
+        call per item. If iid_index is given, that column of each row is used as
+        the item's ID.
+        """
+        with self._bulk_tree(tree):
+            tree.delete(*tree.get_children())
+            insert = tree.insert
+            if iid_index is None:
+                for values in rows:
+                    insert("", "end", values=values)
+            else:
+                for values in rows:
+                    insert("", "end", iid=values[iid_index], values=values)
+
     def populate_dashboard(self):
-        """Fetches data and populates the dashboard widgets."""
+        """Fetches data for the dashboard on the worker thread, then fills its trees."""
+        self._run_in_background("dashboard", self._query_dashboard, self._apply_dashboard)
+
+    def _apply_dashboard(self, results):
+        overdue, upcoming, suggestions = results
+        self._fill_treeview(self.overdue_tree, overdue)
+        self._fill_treeview(self.upcoming_tree, upcoming)
+        self._fill_treeview(self.suggestions_tree, suggestions)
+
+    def _query_dashboard(self):
+        """Returns the overdue reminders, upcoming reminders and contact suggestions."""
         today = datetime.date.today()
         next_week = today + datetime.timedelta(days=7)
 
+        # One query covers all three panels. Each row starts with the index of its
+        # panel, then the values in the tree's column order, with names and dates
+        # formatted by SQLite, and ends with the key it's sorted on.
+        threshold_date = datetime.datetime.now() - datetime.timedelta(days=30)
+        panels = ([], [], [])
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            # Fetch Overdue reminders
-            cursor.execute("""
-                SELECT r.reminder_date, r.message, c.first_name, c.last_name
-                FROM reminders r JOIN contacts c ON r.contact_id = c.id
-                WHERE r.reminder_date < ? ORDER BY r.reminder_date ASC
-            """, (today.strftime('%Y-%m-%d'),))
-            overdue_reminders = cursor.fetchall()
-
-            # Fetch Upcoming reminders
-            cursor.execute("""
-                SELECT r.reminder_date, r.message, c.first_name, c.last_name
-                FROM reminders r JOIN contacts c ON r.contact_id = c.id
-                WHERE r.reminder_date >= ? AND r.reminder_date <= ?
-                ORDER BY r.reminder_date ASC
-            """, (today.strftime('%Y-%m-%d'), next_week.strftime('%Y-%m-%d')))
-            upcoming_reminders = cursor.fetchall()
-
-            # Fetch Contact Suggestions
-            threshold_date = datetime.datetime.now() - datetime.timedelta(days=30)
-            cursor.execute("""
-                SELECT first_name, last_name, last_contacted_at
-                FROM contacts
-                WHERE last_contacted_at < ?
-                ORDER BY last_contacted_at ASC
-            """, (threshold_date,))
-            suggested_contacts = cursor.fetchall()
-
-        # Clear existing data
-        for i in self.overdue_tree.get_children(): self.overdue_tree.delete(i)
-        for i in self.upcoming_tree.get_children(): self.upcoming_tree.delete(i)
-        for i in self.suggestions_tree.get_children(): self.suggestions_tree.delete(i)
-
-        # Populate overdue reminders
-        for r in overdue_reminders:
-            name = f"{r['first_name']} {r['last_name'] or ''}"
-            self.overdue_tree.insert("", "end", values=(r['reminder_date'], name, r['message']))
-
-        # Populate upcoming reminders
-        for r in upcoming_reminders:
-            name = f"{r['first_name']} {r['last_name'] or ''}"
-            self.upcoming_tree.insert("", "end", values=(r['reminder_date'], name, r['message']))
-
-        # Populate suggestions
-        for c in suggested_contacts:
-            name = f"{c['first_name']} {c['last_name'] or ''}"
-            last_contacted_str = c['last_contacted_at'].strftime('%Y-%m-%d')
-            self.suggestions_tree.insert("", "end", values=(name, last_contacted_str))
+            cursor.row_factory = None
+            cursor.execute(_SELECT_DASHBOARD_SQL, {
+                'today': today.strftime('%Y-%m-%d'),
+                'next_week': next_week.strftime('%Y-%m-%d'),
+                'threshold': threshold_date,
+            })
+            for row in cursor:
+                panels[row[0]].append(row[1:-1])
+        overdue, upcoming, suggestions = panels
+        # Suggestions only fill two columns
+        suggestions = [row[:2] for row in suggestions]
+        return overdue, upcoming, suggestions
 
     def setup_graph_tab(self):
         """Sets up the widgets for the relationship graph tab."""
         graph_frame = ttk.Frame(self.graph_tab, padding="10")
         graph_frame.pack(fill="both", expand=True)
 
-        self.G = nx.Graph()
         self.graph_figure = Figure(figsize=(8, 6), dpi=100)
         self.graph_ax = self.graph_figure.add_subplot(111)
-        self.graph_pos = None # To store node positions
+        self._graph_margins_set = False
 
         self.canvas = FigureCanvasTkAgg(self.graph_figure, master=graph_frame)
         self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
@@ -1235,61 +1719,154 @@ class App(tk.Tk):
         self.G.clear()
         self.graph_ax.clear()
 
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            # Fetch all contacts (nodes)
-            cursor.execute("SELECT id, first_name, last_name FROM contacts")
-            db_contacts = cursor.fetchall()
-            # Fetch all relationships (edges)
-            cursor.execute("SELECT contact1_id, contact2_id, relationship_type FROM relationships")
-            db_relationships = cursor.fetchall()
+        # The nodes are every contact, which the id -> name map already holds
+        self._refresh_contact_combos()
 
-        if not db_contacts:
+        if not self.contact_names_by_id:
             self.graph_ax.text(0.5, 0.5, "No contacts to display.", ha='center', va='center')
-            self.canvas.draw()
+            self.canvas.draw_idle()
             return
 
         # Add nodes to the graph
-        for contact in db_contacts:
-            self.G.add_node(contact['id'], name=f"{contact['first_name']} {contact['last_name'] or ''}".strip())
+        self.G.add_nodes_from((contact_id, {'name': name}) for contact_id, name in self.contact_names_by_id.items())
 
-        # Add edges to the graph
-        for rel in db_relationships:
-            # Ensure both nodes exist in the graph before adding an edge
-            if rel['contact1_id'] in self.G and rel['contact2_id'] in self.G:
-                self.G.add_edge(rel['contact1_id'], rel['contact2_id'], label=rel['relationship_type'])
+        # Add edges to the graph, straight from the cursor
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT contact1_id, contact2_id, relationship_type FROM relationships")
+            for rel in cursor:
+                # Ensure both nodes exist in the graph before adding an edge
+                if rel['contact1_id'] in self.G and rel['contact2_id'] in self.G:
+                    self.G.add_edge(rel['contact1_id'], rel['contact2_id'], label=rel['relationship_type'])
 
-        # Calculate layout only if it hasn't been calculated before
+        self._update_graph_layout()
+        self._redraw_graph()
+
+    def _update_graph_layout(self):
+        """
+        Positions the graph's nodes. The full spring layout is only calculated
+        the first time; after that, existing positions (including any the user
+        has dragged) are kept fixed and only contacts without one are placed.
+        From 500 contacts up, networkx switches to its energy-based layout on
+        scipy sparse matrices, which scales far better than the dense one.
+        """
         if self.graph_pos is None:
+            self.graph_pos = self._load_saved_layout()
+            if self.graph_pos is None:
+                self.graph_pos = nx.spring_layout(self.G, k=0.8, iterations=50)
+                self._save_layout()
+            return
+
+        # Forget the positions of contacts that no longer exist
+        self.graph_pos = {node: pos for node, pos in self.graph_pos.items() if node in self.G}
+        if len(self.graph_pos) == len(self.G):
+            return
+
+        if self.graph_pos:
+            self.graph_pos = nx.spring_layout(self.G, k=0.8, iterations=50,
+                                              pos=self.graph_pos, fixed=list(self.graph_pos))
+        else:
             self.graph_pos = nx.spring_layout(self.G, k=0.8, iterations=50)
-        self._redraw_graph()
 
+    def _graph_key(self):
+        """Returns a key that changes whenever the graph's nodes or edges do."""
+        edges = sorted((min(u, v), max(u, v)) for u, v in self.G.edges())
+        return hashlib.sha1(repr((sorted(self.G), edges)).encode()).hexdigest()
+
+    def _load_saved_layout(self):
+        """Returns the layout saved in GRAPH_LAYOUT_FILE if it is for the current graph, else None."""
+        try:
+            with open(GRAPH_LAYOUT_FILE, 'rb') as f:
+                saved = json.load(f)
+            if saved['key'] != self._graph_key():
+                return None
+            return {int(node): np.array(xy, dtype=float) for node, xy in saved['positions'].items()}
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"Ignoring unreadable graph layout file: {e}")
+            return None
+
+    def _save_layout(self):
+        """Saves the current layout to GRAPH_LAYOUT_FILE, keyed by the current graph."""
+        # Plain JSON rather than pickle, since loading a pickle can run code
+        positions = {node: [float(x), float(y)] for node, (x, y) in self.graph_pos.items()}
+        try:
+            with open(GRAPH_LAYOUT_FILE, 'w') as f:
+                json.dump({'key': self._graph_key(), 'positions': positions}, f)
+        except OSError as e:
+            print(f"Could not save the graph layout: {e}")
 
     def _redraw_graph(self):
-        """Clears and redraws the graph."""
+        """
+        Clears and redraws the graph. The artists for the nodes, edges and
+        labels are kept, so dragging a node can move just its own pieces.
+        """
         self.graph_ax.clear()
         labels = nx.get_node_attributes(self.G, 'name')
         edge_labels = nx.get_edge_attributes(self.G, 'label')
 
-        nx.draw(self.G, self.graph_pos, ax=self.graph_ax, with_labels=True, labels=labels,
-                node_color='skyblue', node_size=2000, font_size=8,
-                width=1.5, edge_color='gray')
-        nx.draw_networkx_edge_labels(self.G, self.graph_pos, edge_labels=edge_labels, ax=self.graph_ax, font_size=7)
+        # Offsets and segments are in the order of these lists
+        self._graph_nodes = list(self.G)
+        self._graph_node_index = {node: i for i, node in enumerate(self._graph_nodes)}
+        self._graph_edges = list(self.G.edges())
+        self._node_artist = nx.draw_networkx_nodes(self.G, self.graph_pos, nodelist=self._graph_nodes, ax=self.graph_ax,
+                                                   node_color='skyblue', node_size=2000)
+        self._edge_artist = nx.draw_networkx_edges(self.G, self.graph_pos, edgelist=self._graph_edges, ax=self.graph_ax,
+                                                   width=1.5, edge_color='gray')
+        self._node_label_artists = nx.draw_networkx_labels(self.G, self.graph_pos, labels=labels, ax=self.graph_ax, font_size=8)
+        self._edge_label_artists = nx.draw_networkx_edge_labels(self.G, self.graph_pos, edge_labels=edge_labels,
+                                                                ax=self.graph_ax, font_size=7)
+        self.graph_ax.set_axis_off()
 
         self.graph_ax.set_title("Contact Relationships")
-        self.graph_figure.tight_layout()
-        self.canvas.draw()
+        # The axes only hold the title and the hidden frame, so the margins
+        # tight_layout works out don't change between redraws; it runs once.
+        if not self._graph_margins_set:
+            self.graph_figure.tight_layout()
+            self._graph_margins_set = True
+        # Let Tk repaint when it is next idle, so bursts of updates (e.g. while
+        # dragging a node) are drawn once.
+        self.canvas.draw_idle()
+
+    @staticmethod
+    def _grid_cell(x, y):
+        """Returns the hit-test grid cell containing a point. Cells are _NODE_HIT_RADIUS wide."""
+        return (math.floor(x / _NODE_HIT_RADIUS), math.floor(y / _NODE_HIT_RADIUS))
+
+    def _node_grid(self):
+        """
+        Returns the graph's nodes bucketed by grid cell, rebuilding the buckets
+        whenever graph_pos has been replaced (a new layout or an import).
+        Dragging moves a node between buckets without a rebuild.
+        """
+        if self._pos_grid_source is not self.graph_pos:
+            self._pos_grid = defaultdict(list)
+            for node_id, (x, y) in self.graph_pos.items():
+                self._pos_grid[self._grid_cell(x, y)].append(node_id)
+            self._pos_grid_source = self.graph_pos
+        return self._pos_grid
 
     def _get_node_at_event(self, event):
-        """Finds the node at the event's coordinates, if any."""
+        """
+        Finds the node nearest the event's coordinates, if one is close enough.
+        Any such node is in the event's grid cell or one of the eight around
+        it, so only those are checked.
+        """
         if self.graph_pos is None or event.xdata is None or event.ydata is None:
             return None
 
-        for node_id, (x, y) in self.graph_pos.items():
-            dist = ((event.xdata - x)**2 + (event.ydata - y)**2)**0.5
-            if dist < 0.1: # This threshold might need adjustment
-                return node_id
-        return None
+        grid = self._node_grid()
+        cx, cy = self._grid_cell(event.xdata, event.ydata)
+        nearest, nearest_dist = None, _NODE_HIT_RADIUS
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for node_id in grid.get((cx + dx, cy + dy), ()):
+                    x, y = self.graph_pos[node_id]
+                    dist = math.hypot(event.xdata - x, event.ydata - y)
+                    if dist < nearest_dist:
+                        nearest, nearest_dist = node_id, dist
+        return nearest
 
     def on_graph_click(self, event):
         """Handler for clicking on the relationship graph."""
@@ -1304,17 +1881,58 @@ class App(tk.Tk):
             self._view_contact_details_by_id(node_id)
         else:
             self._dragged_node = node_id
+            # Positions in _graph_edges of the edges that move with the node
+            self._dragged_edges = [i for i, edge in enumerate(self._graph_edges) if node_id in edge]
 
     def on_graph_motion(self, event):
         """Handler for mouse motion on the graph."""
         if self._dragged_node is None or event.inaxes != self.graph_ax or event.xdata is None:
             return
+        old_cell = self._grid_cell(*self.graph_pos[self._dragged_node])
+        new_cell = self._grid_cell(event.xdata, event.ydata)
+        if old_cell != new_cell and self._pos_grid_source is self.graph_pos:
+            self._pos_grid[old_cell].remove(self._dragged_node)
+            self._pos_grid[new_cell].append(self._dragged_node)
         self.graph_pos[self._dragged_node] = (event.xdata, event.ydata)
-        self._redraw_graph()
+        self._move_dragged_node()
+
+    def _move_dragged_node(self):
+        """
+        Moves the dragged node's marker, label, edges and edge labels to its
+        position in graph_pos, leaving every other artist alone.
+        """
+        node = self._dragged_node
+        x, y = self.graph_pos[node]
+
+        offsets = self._node_artist.get_offsets()
+        offsets[self._graph_node_index[node]] = (x, y)
+        self._node_artist.set_offsets(offsets)
+        self._node_label_artists[node].set_position((x, y))
+
+        if self._dragged_edges:
+            segments = self._edge_artist.get_segments()
+            moved_labels = {}
+            for i in self._dragged_edges:
+                u, v = self._graph_edges[i]
+                segments[i] = np.array([self.graph_pos[u], self.graph_pos[v]])
+                # Edge labels are placed (and angled) by networkx, so the
+                # label is drawn again rather than moved
+                old_label = self._edge_label_artists.pop((u, v), None)
+                if old_label is not None:
+                    old_label.remove()
+                    moved_labels[(u, v)] = old_label.get_text()
+            self._edge_artist.set_segments(segments)
+            self._edge_label_artists.update(nx.draw_networkx_edge_labels(
+                self.G, self.graph_pos, edge_labels=moved_labels, ax=self.graph_ax, font_size=7))
+
+        self.canvas.draw_idle()
 
     def on_graph_release(self, event):
         """Handler for releasing the mouse button on the graph."""
-        self._dragged_node = None
+        if self._dragged_node is not None:
+            self._dragged_node = None
+            # Redraw everything once, so the axes and layout fit the new position
+            self._redraw_graph()
 
 
 def main():
@@ -4,6 +4,11 @@ from .database import get_db_connection
 from .contacts import choose_contact, _update_last_contacted
 from .google_calendar import create_calendar_event
 
+# The note insert is shared by add_note and log_interaction; one SQL string
+# means one prepared statement in sqlite3's statement cache.
+_INSERT_NOTE_SQL = "INSERT INTO notes (contact_id, note_text) VALUES (?, ?)"
+_INSERT_REMINDER_SQL = "INSERT INTO reminders (contact_id, message, reminder_date) VALUES (?, ?, ?)"
+
 def add_note(full_name, message):
     """Adds a note for a specific contact."""
     contact_id = choose_contact(full_name)
@@ -12,7 +17,7 @@ def add_note(full_name, message):
 
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("INSERT INTO notes (contact_id, note_text) VALUES (?, ?)", (contact_id, message))
+        cursor.execute(_INSERT_NOTE_SQL, (contact_id, message))
         conn.commit()
     _update_last_contacted(contact_id)
     print(f"Note added for {full_name}.")
@@ -27,7 +32,7 @@ def log_interaction(full_name, message):
     # We can log the interaction as a note
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("INSERT INTO notes (contact_id, note_text) VALUES (?, ?)", (contact_id, f"Logged interaction: {message}"))
+        cursor.execute(_INSERT_NOTE_SQL, (contact_id, f"Logged interaction: {message}"))
         conn.commit()
 
     _update_last_contacted(contact_id)
@@ -50,7 +55,7 @@ def add_reminder(full_name, message, date_str):
 
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("INSERT INTO reminders (contact_id, message, reminder_date) VALUES (?, ?, ?)", (contact_id, message, date_str))
+        cursor.execute(_INSERT_REMINDER_SQL, (contact_id, message, date_str))
         conn.commit()
     _update_last_contacted(contact_id)
     console.print(f"Reminder set for {full_name} on {date_str}.", style="green")
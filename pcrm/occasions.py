@@ -1,6 +1,7 @@
 import datetime
 from .database import get_db_connection
 from .contacts import choose_contact
+from .utils import parse_date
 from rich.console import Console
 from rich.table import Table
 
@@ -33,7 +34,7 @@ def add_gift(full_name, description, direction, date_str=None, occasion_id=None)
 
     if date_str:
         try:
-            datetime.datetime.strptime(date_str, '%Y-%m-%d')
+            parse_date(date_str)
         except ValueError:
             console.print("Error: Date must be in YYYY-MM-DD format.", style="bold red")
             return
@@ -0,0 +1,49 @@
+import datetime
+import os
+import tempfile
+import types
+import unittest
+from collections import OrderedDict
+
+from pcrm import database
+from pcrm.gui import App
+
+
+class ContactRowsTest(unittest.TestCase):
+    """The contacts tree rows built by SQLite read dates the way the app accepts them."""
+
+    def setUp(self):
+        self._db_file = database.DB_FILE
+        self._tmp = tempfile.TemporaryDirectory()
+        database.close_db()
+        database.DB_FILE = os.path.join(self._tmp.name, "test.db")
+        database.create_tables()
+
+    def tearDown(self):
+        database.close_db()
+        database.DB_FILE = self._db_file
+        self._tmp.cleanup()
+
+    def _rows(self, today):
+        app = types.SimpleNamespace(_contact_rows_cache=OrderedDict())
+        return App._fetch_contact_rows(app, None, None, "first_name", "asc", today)
+
+    def test_unpadded_dates(self):
+        with database.get_db_connection() as conn:
+            conn.execute(
+                "INSERT INTO contacts (first_name, birthday, date_met) VALUES ('Ada', '1990-2-3', '2024-1-5')"
+            )
+            conn.execute(
+                "INSERT INTO contacts (first_name, birthday, date_met) VALUES ('Bo', 'soon', 'someday')"
+            )
+            conn.commit()
+
+        ada, bo = self._rows(datetime.date(2025, 1, 5))
+        self.assertEqual(ada[4], "1990-02-03")
+        self.assertEqual(ada[6], "1.00 years")
+        self.assertEqual(bo[4], "soon")
+        self.assertEqual(bo[6], "Invalid date")
+
+
+if __name__ == "__main__":
+    unittest.main()
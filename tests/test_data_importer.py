@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+
+from pcrm import database
+from pcrm.data_exporter import export_data_to_json
+from pcrm.data_importer import import_data_from_json
+
+
+class JsonRoundTripTest(unittest.TestCase):
+    """Exporting to JSON and importing it back leaves the database as it was."""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._db_file = database.DB_FILE
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        database.close_db()
+        database.DB_FILE = os.path.join(self._tmp.name, "test.db")
+        database.create_tables()
+
+    def tearDown(self):
+        database.close_db()
+        database.DB_FILE = self._db_file
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _count(self, table):
+        with database.get_db_connection() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def test_child_tables_survive_import(self):
+        # Reminders, occasions and gifts aren't part of the export, so the
+        # import must not clear them along with the contacts they belong to
+        with database.get_db_connection() as conn:
+            contact_id = conn.execute(
+                "INSERT INTO contacts (first_name, last_name) VALUES ('Ada', 'Lovelace')"
+            ).lastrowid
+            conn.execute("INSERT INTO phones (contact_id, phone_number, phone_type) VALUES (?, '555-0100', 'mobile')", (contact_id,))
+            conn.execute("INSERT INTO reminders (contact_id, message, reminder_date) VALUES (?, 'Call', '2024-01-05')", (contact_id,))
+            occasion_id = conn.execute(
+                "INSERT INTO special_occasions (contact_id, name, date) VALUES (?, 'Birthday', '2024-12-10')", (contact_id,)
+            ).lastrowid
+            conn.execute(
+                "INSERT INTO gifts (contact_id, description, direction, occasion_id) VALUES (?, 'Book', 'given', ?)",
+                (contact_id, occasion_id)
+            )
+            conn.commit()
+
+        export_data_to_json(None)
+        import_data_from_json("pcrm_export.json")
+
+        for table in ("contacts", "phones", "reminders", "special_occasions", "gifts"):
+            self.assertEqual(self._count(table), 1, table)
+        with database.get_db_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()